@@ -281,9 +281,10 @@ def cmd_context_show(cfg: Config, args: ContextShowArgs) -> None:
     default_path = get_context_path_for_repo(cfg.repo)
     output_path = args.output or default_path
 
-    if not context_exists(output_path):
-        sys.exit(f"Context file not found: {output_path}\nRun 'jira-agent context generate' to create it.")
-    content = load_context(output_path)
+    try:
+        content = load_context(output_path)
+    except FileNotFoundError as e:
+        sys.exit(str(e))
     print(content)
 
 
@@ -58,11 +58,14 @@ def load_context(context_path: Path) -> str:
     Raises:
         FileNotFoundError: If context file doesn't exist.
     """
-    if not context_path.exists():
+    # Open directly instead of stat-then-open: one syscall on the common
+    # path, and no race between the existence check and the read.
+    try:
+        return context_path.read_text()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Context file not found: {context_path}\nRun 'jira-agent context generate' to create it."
-        )
-    return context_path.read_text()
+        ) from None
 
 
 def context_exists(context_path: Path) -> bool:
@@ -74,7 +77,9 @@ def context_exists(context_path: Path) -> bool:
     Returns:
         True if context file exists.
     """
-    return context_path.exists()
+    # os.access(F_OK) only probes the existence bit; Path.exists() does a
+    # full os.stat and builds a stat_result we would throw away.
+    return os.access(context_path, os.F_OK)
 
 
 def generate_context(repo_path: Path, output_path: Path, deep: bool = False) -> str:
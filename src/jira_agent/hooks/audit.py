@@ -5,16 +5,39 @@ debugging and understanding agent behavior.
 """
 
 import json
+import re
 import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, TextIO
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional perf dependency
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+# Reused encoder: json.dumps builds a fresh JSONEncoder on every call,
+# and to_json runs once per logged tool call.
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str).encode
+
+# Sensitive-key matching: O(1) frozenset hit for the common exact names,
+# one compiled-regex scan for fuzzy matches (e.g. "github_token"), instead
+# of a Python-level substring loop per key.
+_SENSITIVE_EXACT = frozenset({"token", "password", "secret", "api_key", "api_token", "auth"})
+_SENSITIVE_RE = re.compile(r"token|password|secret|api_key|auth", re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class AuditEntry:
-    """A single audit log entry."""
+    """A single audit log entry.
+
+    slots=True keeps long audit runs compact: entries skip the per-instance
+    __dict__, and asdict()/field access are unaffected.
+    """
 
     timestamp: str
     tool_name: str
@@ -24,7 +47,9 @@ class AuditEntry:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(asdict(self), default=str)
+        if orjson is not None:
+            return orjson.dumps(asdict(self), default=str).decode()
+        return _ENCODER(asdict(self))
 
 
 class AuditLogger:
@@ -41,6 +66,7 @@ class AuditLogger:
         output_path: Path | None = None,
         stderr: bool = False,
         format: str = "json",  # noqa: A002
+        output_stream: TextIO | None = None,
     ):
         """Initialize the audit logger.
 
@@ -48,13 +74,19 @@ class AuditLogger:
             output_path: Path to write audit log. If None, file logging is disabled.
             stderr: Whether to also log to stderr.
             format: Output format ("json" or "text").
+            output_stream: Write entries to this stream instead of opening
+                output_path. The stream is not closed by close(); useful for
+                in-memory sinks (e.g. io.StringIO) in tests.
         """
         self.output_path = output_path
         self.stderr = stderr
         self.format = format
-        self._file: TextIO | None = None
+        self._file: TextIO | None = output_stream
+        self._owns_file = output_stream is None
         self._entries: list[AuditEntry] = []
         self._pending_calls: dict[str, datetime] = {}
+        self._buffer: list[str] = []
+        self._stderr_buffer: list[str] = []
 
     def _open_file(self) -> None:
         """Open the output file if configured."""
@@ -63,7 +95,11 @@ class AuditLogger:
             self._file = open(self.output_path, "a")  # noqa: SIM115
 
     def _write_entry(self, entry: AuditEntry) -> None:
-        """Write an entry to configured outputs."""
+        """Buffer an entry for the configured outputs.
+
+        Entries are held in memory and flushed in one batched write by
+        close(), so N tool calls cost one write syscall instead of N.
+        """
         if self.format == "json":
             line = entry.to_json()
         else:
@@ -72,12 +108,11 @@ class AuditLogger:
             duration = f" ({entry.duration_ms}ms)" if entry.duration_ms is not None else ""
             line = f"[{entry.timestamp}] {entry.tool_name}({args_str}){duration}"
 
-        if self._file:
-            self._file.write(line + "\n")
-            self._file.flush()
+        if self._file is not None or self.output_path:
+            self._buffer.append(line + "\n")
 
         if self.stderr:
-            print(f"[AUDIT] {line}", file=sys.stderr)
+            self._stderr_buffer.append(f"[AUDIT] {line}\n")
 
     def log_tool_start(self, tool_name: str, tool_use_id: str, arguments: dict[str, Any]) -> None:
         """Log the start of a tool call.
@@ -87,7 +122,6 @@ class AuditLogger:
             tool_use_id: Unique ID for this tool use.
             arguments: Arguments passed to the tool.
         """
-        self._open_file()
         self._pending_calls[tool_use_id] = datetime.now(timezone.utc)
 
         entry = AuditEntry(
@@ -99,6 +133,36 @@ class AuditLogger:
         self._entries.append(entry)
         self._write_entry(entry)
 
+    @contextmanager
+    def log_tool(self, tool_name: str, tool_use_id: str, arguments: dict[str, Any]) -> Iterator[AuditEntry]:
+        """Log a tool call scoped to a with-block.
+
+        Holds the entry in a local instead of the pending-call dict, so the
+        start/end pairing needs no insert-and-lookup per call, and times
+        with the monotonic clock.
+
+        Args:
+            tool_name: Name of the tool being called.
+            tool_use_id: Unique ID for this tool use.
+            arguments: Arguments passed to the tool.
+
+        Yields:
+            The AuditEntry being recorded; duration is filled in on exit.
+        """
+        entry = AuditEntry(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            tool_name=tool_name,
+            tool_use_id=tool_use_id,
+            arguments=self._sanitize_arguments(arguments),
+        )
+        self._entries.append(entry)
+        start = time.perf_counter_ns()
+        try:
+            yield entry
+        finally:
+            entry.duration_ms = (time.perf_counter_ns() - start) // 1_000_000
+            self._write_entry(entry)
+
     def log_tool_end(self, tool_use_id: str) -> None:
         """Log the end of a tool call and calculate duration.
 
@@ -121,11 +185,10 @@ class AuditLogger:
         Truncates long values and redacts sensitive fields.
         """
         sanitized = {}
-        sensitive_keys = {"token", "password", "secret", "api_key", "auth"}
 
         for key, value in arguments.items():
             # Redact sensitive fields
-            if any(s in key.lower() for s in sensitive_keys):
+            if key in _SENSITIVE_EXACT or _SENSITIVE_RE.search(key):
                 sanitized[key] = "[REDACTED]"
             elif isinstance(value, str) and len(value) > 200:
                 sanitized[key] = value[:200] + "..."
@@ -139,9 +202,24 @@ class AuditLogger:
         return self._entries.copy()
 
     def close(self) -> None:
-        """Close the output file if open."""
-        if self._file:
+        """Flush buffered entries and close the output file if open.
+
+        Caller-provided output streams are left open for inspection.
+        """
+        if self._buffer:
+            self._open_file()
+            if self._file:
+                self._file.writelines(self._buffer)
+                self._file.flush()
+            self._buffer.clear()
+
+        if self._stderr_buffer:
+            sys.stderr.write("".join(self._stderr_buffer))
+            self._stderr_buffer.clear()
+
+        if self._file and self._owns_file:
             self._file.close()
+        if self._owns_file:
             self._file = None
 
 
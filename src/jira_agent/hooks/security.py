@@ -3,6 +3,7 @@
 Prevents the agent from modifying sensitive paths or running dangerous commands.
 """
 
+import functools
 import re
 from typing import Any
 
@@ -13,21 +14,33 @@ class SecurityViolation(Exception):
     pass
 
 
-# Paths that should never be modified
+# Paths that should never be modified.
+# Inner groups are non-capturing so the combined alternation below can
+# identify the firing pattern via Match.lastgroup.
 BLOCKED_PATH_PATTERNS = [
-    r"\.git(/|$)",  # .git directory
-    r"\.env($|\.)",  # .env files
-    r"node_modules(/|$)",  # node_modules directory
-    r"\.ssh(/|$)",  # SSH keys
-    r"\.aws(/|$)",  # AWS credentials
-    r"\.gnupg(/|$)",  # GPG keys
-    r"__pycache__(/|$)",  # Python cache
-    r"\.venv(/|$)",  # Virtual environment
-    r"venv(/|$)",  # Virtual environment
+    r"\.git(?:/|$)",  # .git directory
+    r"\.env(?:$|\.)",  # .env files
+    r"node_modules(?:/|$)",  # node_modules directory
+    r"\.ssh(?:/|$)",  # SSH keys
+    r"\.aws(?:/|$)",  # AWS credentials
+    r"\.gnupg(?:/|$)",  # GPG keys
+    r"__pycache__(?:/|$)",  # Python cache
+    r"\.venv(?:/|$)",  # Virtual environment
+    r"venv(?:/|$)",  # Virtual environment
 ]
 
-# Compiled patterns for efficiency
-_PATH_PATTERNS = [re.compile(p) for p in BLOCKED_PATH_PATTERNS]
+# One combined alternation: a single C-level search decides all patterns,
+# and the named group that matched maps back to the original pattern for
+# the reason string.
+_PATH_RE = re.compile("|".join(f"(?P<p{i}>{p})" for i, p in enumerate(BLOCKED_PATH_PATTERNS)))
+_PATH_REASONS = {f"p{i}": p for i, p in enumerate(BLOCKED_PATH_PATTERNS)}
+
+# Literal prefilter: every blocked-path pattern contains one of these
+# substrings, so a path containing none of them cannot match any pattern.
+# Normal paths (the overwhelmingly common case) are cleared by C-level
+# substring scans without entering the regex engine; the regexes only run
+# on hits, to disambiguate e.g. ".gitignore" from ".git/".
+_PATH_LITERALS = (".git", ".env", "node_modules", ".ssh", ".aws", ".gnupg", "__pycache__", "venv")
 
 # Dangerous command patterns
 BLOCKED_COMMAND_PATTERNS = [
@@ -64,13 +77,21 @@ BLOCKED_COMMAND_PATTERNS = [
     r"git\s+filter-branch",  # history rewriting
 ]
 
-# Compiled command patterns
-_COMMAND_PATTERNS = [re.compile(p, re.IGNORECASE) for p in BLOCKED_COMMAND_PATTERNS]
+# Combined command alternation, same scheme as _PATH_RE
+_COMMAND_RE = re.compile(
+    "|".join(f"(?P<c{i}>{p})" for i, p in enumerate(BLOCKED_COMMAND_PATTERNS)),
+    re.IGNORECASE,
+)
+_COMMAND_REASONS = {f"c{i}": p for i, p in enumerate(BLOCKED_COMMAND_PATTERNS)}
 
 
+@functools.lru_cache(maxsize=2048)
 def is_path_blocked(path: str) -> tuple[bool, str | None]:
     """Check if a path is blocked for modification.
 
+    Results are memoized: agents touch the same file repeatedly
+    (edit-after-edit), so hot paths hit the cache instead of the scan.
+
     Args:
         path: The file path to check.
 
@@ -80,16 +101,24 @@ def is_path_blocked(path: str) -> tuple[bool, str | None]:
     if not path:
         return False, None
 
-    for pattern in _PATH_PATTERNS:
-        if pattern.search(path):
-            return True, f"Path matches blocked pattern: {pattern.pattern}"
+    # Cheap pre-check; the expensive regex pass only runs on literal hits
+    if not any(literal in path for literal in _PATH_LITERALS):
+        return False, None
+
+    match = _PATH_RE.search(path)
+    if match:
+        return True, f"Path matches blocked pattern: {_PATH_REASONS[match.lastgroup]}"
 
     return False, None
 
 
+@functools.lru_cache(maxsize=2048)
 def is_command_blocked(command: str) -> tuple[bool, str | None]:
     """Check if a bash command is blocked.
 
+    Memoized like is_path_blocked; repeated commands (git status, test
+    runs) skip the pattern scan.
+
     Args:
         command: The command string to check.
 
@@ -99,13 +128,40 @@ def is_command_blocked(command: str) -> tuple[bool, str | None]:
     if not command:
         return False, None
 
-    for pattern in _COMMAND_PATTERNS:
-        if pattern.search(command):
-            return True, f"Command matches blocked pattern: {pattern.pattern}"
+    match = _COMMAND_RE.search(command)
+    if match:
+        return True, f"Command matches blocked pattern: {_COMMAND_REASONS[match.lastgroup]}"
 
     return False, None
 
 
+def _check_file_tool(tool_input: dict[str, Any]) -> tuple[bool, str | None]:
+    """Check a file-modifying tool call against the path blocklist."""
+    file_path = tool_input.get("file_path", "") or tool_input.get("notebook_path", "")
+    blocked, reason = is_path_blocked(file_path)
+    if blocked:
+        return False, f"Blocked file operation on {file_path}: {reason}"
+    return True, None
+
+
+def _check_bash_tool(tool_input: dict[str, Any]) -> tuple[bool, str | None]:
+    """Check a Bash tool call against the command blocklist."""
+    blocked, reason = is_command_blocked(tool_input.get("command", ""))
+    if blocked:
+        return False, f"Blocked command: {reason}"
+    return True, None
+
+
+# Tool-name dispatch: one dict probe per call instead of chained compares;
+# tools without a checker are allowed.
+_TOOL_CHECKS = {
+    "Edit": _check_file_tool,
+    "Write": _check_file_tool,
+    "NotebookEdit": _check_file_tool,
+    "Bash": _check_bash_tool,
+}
+
+
 def check_tool_security(tool_name: str, tool_input: dict[str, Any]) -> tuple[bool, str | None]:
     """Check if a tool call is allowed.
 
@@ -116,21 +172,16 @@ def check_tool_security(tool_name: str, tool_input: dict[str, Any]) -> tuple[boo
     Returns:
         Tuple of (is_allowed, error_message). If allowed, error_message is None.
     """
-    # Check file operations
-    if tool_name in ("Edit", "Write", "NotebookEdit"):
-        file_path = tool_input.get("file_path", "") or tool_input.get("notebook_path", "")
-        blocked, reason = is_path_blocked(file_path)
-        if blocked:
-            return False, f"Blocked file operation on {file_path}: {reason}"
-
-    # Check bash commands
-    if tool_name == "Bash":
-        command = tool_input.get("command", "")
-        blocked, reason = is_command_blocked(command)
-        if blocked:
-            return False, f"Blocked command: {reason}"
+    check = _TOOL_CHECKS.get(tool_name)
+    if check is None:
+        return True, None
+    return check(tool_input)
 
-    return True, None
+
+# Shared "allowed" result for the hook hot path: the SDK only reads the
+# returned mapping, so one empty dict serves every allowed call instead of
+# allocating a fresh one per tool invocation.
+_ALLOW_RESULT: dict[str, Any] = {}
 
 
 def make_security_hook():
@@ -160,7 +211,7 @@ def make_security_hook():
             }
 
         # Allow the operation
-        return {}
+        return _ALLOW_RESULT
 
     return security_hook
 
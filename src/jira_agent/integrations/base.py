@@ -1,28 +1,55 @@
 """Base classes for integrations."""
 
+import asyncio
+import functools
 import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
+# Concurrent query() calls against the same SDK MCP server are not re-entrant
+# and hang until the 60s timeout, so serialize them per integration. Non-MCP
+# integrations (e.g. JiraClient) are unaffected and still run concurrently.
+_MCP_QUERY_LOCKS: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
-class HealthStatus(Enum):
-    """Health check status."""
+
+def _get_mcp_lock(name: str) -> asyncio.Lock:
+    """Return the per-integration lock serializing SDK MCP queries."""
+    return _MCP_QUERY_LOCKS[name]
+
+
+@functools.lru_cache(maxsize=1)
+def _sdk_available() -> bool:
+    """Whether claude_agent_sdk is importable (probed once per process)."""
+    try:
+        import claude_agent_sdk  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+class HealthStatus(StrEnum):
+    """Health check status.
+
+    StrEnum so members compare as plain strings without wrapper-object cost.
+    """
 
     OK = "ok"
     FAILED = "failed"
     TIMEOUT = "timeout"
 
 
-class HealthCheckTier(Enum):
+class HealthCheckTier(StrEnum):
     """Health check tier."""
 
     CONFIG = "config"  # Tier 1: fast, no network
     CONNECTIVITY = "connectivity"  # Tier 2: slow, network calls
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthCheckResult:
     """Result of a health check."""
 
@@ -72,6 +99,25 @@ class Integration(ABC):
         """
         ...
 
+    def _mk_result(self, start: int, status: HealthStatus, message: str) -> HealthCheckResult:
+        """Build a Tier 2 (connectivity) result, computing duration from `start`.
+
+        Args:
+            start: time.monotonic_ns() value captured at check entry.
+            status: Health status for the result.
+            message: Human-readable detail message.
+
+        Returns:
+            HealthCheckResult with CONNECTIVITY tier and computed duration.
+        """
+        return HealthCheckResult(
+            name=self.name,
+            status=status,
+            message=message,
+            duration_ms=(time.monotonic_ns() - start) // 1_000_000,
+            tier=HealthCheckTier.CONNECTIVITY,
+        )
+
 
 class MCPIntegration(Integration):
     """Base class for MCP-based integrations.
@@ -100,25 +146,24 @@ class MCPIntegration(Integration):
         Returns:
             HealthCheckResult with FAILED status if SDK not installed, None if OK.
         """
-        try:
-            import claude_agent_sdk  # noqa: F401
-
-            return None  # SDK available
-        except ImportError:
-            return HealthCheckResult(
-                name=self.name,
-                status=HealthStatus.FAILED,
-                message="claude_agent_sdk not installed",
-                duration_ms=0,
-                tier=HealthCheckTier.CONFIG,
-            )
+        if _sdk_available():
+            return None
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.FAILED,
+            message="claude_agent_sdk not installed",
+            duration_ms=0,
+            tier=HealthCheckTier.CONFIG,
+        )
 
     @abstractmethod
-    def get_tools(self) -> list[str]:
-        """Return list of MCP tool names this integration provides.
+    def get_tools(self) -> tuple[str, ...]:
+        """Return the MCP tool names this integration provides.
 
         Returns:
-            List of tool names (e.g., ["mcp__atlassian__getJiraIssue"]).
+            Tuple of tool names (e.g., ("mcp__atlassian__getJiraIssue",)).
+            Implementations return a shared module-level constant, so callers
+            must not mutate the result.
         """
         ...
 
@@ -150,6 +195,25 @@ class MCPIntegration(Integration):
         """
         return 3
 
+    @functools.cached_property
+    def _health_check_options(self) -> Any:
+        """ClaudeAgentOptions for the health check, built once per instance.
+
+        The inputs (MCP config, tools, max turns) never change for a given
+        instance, so there is no need to rebuild the options each check.
+
+        Returns:
+            ClaudeAgentOptions configured for this integration's health check.
+        """
+        from claude_agent_sdk import ClaudeAgentOptions
+
+        return ClaudeAgentOptions(
+            mcp_servers=self.get_mcp_config(),
+            allowed_tools=self._get_health_check_tools(),
+            max_turns=self._get_health_check_max_turns(),
+            permission_mode="bypassPermissions",
+        )
+
     async def check_health(self) -> HealthCheckResult:
         """Tier 2: Check MCP connectivity.
 
@@ -171,91 +235,56 @@ class MCPIntegration(Integration):
         Returns:
             HealthCheckResult with status and details.
         """
-        start = time.monotonic()
+        start = time.monotonic_ns()
 
         try:
             from claude_agent_sdk import (
-                ClaudeAgentOptions,
                 ResultMessage,
                 SystemMessage,
                 query,
             )
 
-            options = ClaudeAgentOptions(
-                mcp_servers=self.get_mcp_config(),
-                allowed_tools=self._get_health_check_tools(),
-                max_turns=self._get_health_check_max_turns(),
-                permission_mode="bypassPermissions",
-            )
+            options = self._health_check_options
 
             mcp_connected = False
             mcp_error: str | None = None
             result: HealthCheckResult | None = None
 
-            async for message in query(
-                prompt=self._get_health_check_prompt(),
-                options=options,
-            ):
-                if isinstance(message, SystemMessage):
-                    if hasattr(message, "mcp_servers") and message.mcp_servers:
-                        for server in message.mcp_servers:
-                            status = getattr(server, "status", "unknown")
-                            if status == "connected":
-                                mcp_connected = True
-                            else:
-                                mcp_error = getattr(server, "error", f"Status: {status}")
-
-                elif isinstance(message, ResultMessage):
-                    duration = int((time.monotonic() - start) * 1000)
-                    if message.is_error:
-                        result = HealthCheckResult(
-                            name=self.name,
-                            status=HealthStatus.FAILED,
-                            message=f"Query failed: {message.result}",
-                            duration_ms=duration,
-                            tier=HealthCheckTier.CONNECTIVITY,
-                        )
-                    elif mcp_connected:
-                        result = HealthCheckResult(
-                            name=self.name,
-                            status=HealthStatus.OK,
-                            message="MCP server connected and responding",
-                            duration_ms=duration,
-                            tier=HealthCheckTier.CONNECTIVITY,
-                        )
-                    break  # Exit loop properly to allow generator cleanup
+            async with _get_mcp_lock(self.name):
+                async for message in query(
+                    prompt=self._get_health_check_prompt(),
+                    options=options,
+                ):
+                    if isinstance(message, SystemMessage):
+                        # SystemMessage's schema is fixed, so read the attributes
+                        # directly instead of probing with hasattr per message.
+                        servers = getattr(message, "mcp_servers", None)
+                        if servers:
+                            for server in servers:
+                                status = server.status
+                                if status == "connected":
+                                    mcp_connected = True
+                                else:
+                                    # Only format the fallback when there is no error text.
+                                    mcp_error = getattr(server, "error", None) or f"Status: {status}"
+
+                    elif isinstance(message, ResultMessage):
+                        if message.is_error:
+                            result = self._mk_result(start, HealthStatus.FAILED, f"Query failed: {message.result}")
+                        elif mcp_connected:
+                            result = self._mk_result(start, HealthStatus.OK, "MCP server connected and responding")
+                        break  # Exit loop properly to allow generator cleanup
 
             if result:
                 return result
 
-            duration = int((time.monotonic() - start) * 1000)
-
             if mcp_error:
-                return HealthCheckResult(
-                    name=self.name,
-                    status=HealthStatus.FAILED,
-                    message=f"MCP server error: {mcp_error}",
-                    duration_ms=duration,
-                    tier=HealthCheckTier.CONNECTIVITY,
-                )
-
-            return HealthCheckResult(
-                name=self.name,
-                status=HealthStatus.FAILED,
-                message="MCP query completed without result",
-                duration_ms=duration,
-                tier=HealthCheckTier.CONNECTIVITY,
-            )
+                return self._mk_result(start, HealthStatus.FAILED, f"MCP server error: {mcp_error}")
+
+            return self._mk_result(start, HealthStatus.FAILED, "MCP query completed without result")
 
         except Exception as e:
-            duration = int((time.monotonic() - start) * 1000)
-            return HealthCheckResult(
-                name=self.name,
-                status=HealthStatus.FAILED,
-                message=f"Exception: {type(e).__name__}: {e}",
-                duration_ms=duration,
-                tier=HealthCheckTier.CONNECTIVITY,
-            )
+            return self._mk_result(start, HealthStatus.FAILED, f"Exception: {type(e).__name__}: {e}")
 
 
 class HTTPIntegration(Integration):
@@ -13,6 +13,21 @@ from jira_agent.integrations.base import (
     MCPIntegration,
 )
 
+# Tool name constants, hoisted so hot paths don't rebuild the lists per call.
+_ALL_TOOLS = (
+    "mcp__chrome-devtools__navigate",
+    "mcp__chrome-devtools__take_screenshot",
+    "mcp__chrome-devtools__click",
+    "mcp__chrome-devtools__type",
+    "mcp__chrome-devtools__get_content",
+    "mcp__chrome-devtools__evaluate",
+)
+_HEALTH_CHECK_TOOLS = (
+    "mcp__chrome-devtools__navigate",
+    "mcp__chrome-devtools__take_screenshot",
+)
+_NAV_SCREENSHOT_TOOLS = _HEALTH_CHECK_TOOLS
+
 
 class BrowserMCP(MCPIntegration):
     """Browser automation via Chrome DevTools MCP server.
@@ -31,37 +46,33 @@ class BrowserMCP(MCPIntegration):
         """
         self.browser_url = browser_url
 
-    def get_mcp_config(self) -> dict[str, Any]:
-        """Return MCP server configuration for the agent.
-
-        Returns:
-            Dict with MCP server configuration for Chrome DevTools.
-        """
+        # Config never changes after init, so build it once instead of per call.
         args = ["-y", "chrome-devtools-mcp@latest"]
         if self.browser_url:
             args.append(f"--browser-url={self.browser_url}")
 
-        return {
+        self._mcp_config: dict[str, Any] = {
             "chrome-devtools": {
                 "command": "npx",
                 "args": args,
             }
         }
 
-    def get_tools(self) -> list[str]:
-        """Return list of MCP tool names this integration provides.
+    def get_mcp_config(self) -> dict[str, Any]:
+        """Return MCP server configuration for the agent.
+
+        Returns:
+            Dict with MCP server configuration for Chrome DevTools.
+        """
+        return self._mcp_config
+
+    def get_tools(self) -> tuple[str, ...]:
+        """Return the MCP tool names this integration provides.
 
         Returns:
-            List of Chrome DevTools MCP tool names.
+            Tuple of Chrome DevTools MCP tool names (shared constant, do not mutate).
         """
-        return [
-            "mcp__chrome-devtools__navigate",
-            "mcp__chrome-devtools__take_screenshot",
-            "mcp__chrome-devtools__click",
-            "mcp__chrome-devtools__type",
-            "mcp__chrome-devtools__get_content",
-            "mcp__chrome-devtools__evaluate",
-        ]
+        return _ALL_TOOLS
 
     def check_config(self) -> HealthCheckResult:
         """Tier 1: Check configuration (imports). No network calls.
@@ -89,10 +100,7 @@ class BrowserMCP(MCPIntegration):
 
     def _get_health_check_tools(self) -> list[str]:
         """Return the allowed tools for health check query."""
-        return [
-            "mcp__chrome-devtools__navigate",
-            "mcp__chrome-devtools__take_screenshot",
-        ]
+        return list(_HEALTH_CHECK_TOOLS)
 
     def _get_health_check_max_turns(self) -> int:
         """Return max turns for health check (browser needs more turns)."""
@@ -121,10 +129,7 @@ class BrowserMCP(MCPIntegration):
 
             options = ClaudeAgentOptions(
                 mcp_servers=self.get_mcp_config(),
-                allowed_tools=[
-                    "mcp__chrome-devtools__navigate",
-                    "mcp__chrome-devtools__take_screenshot",
-                ],
+                allowed_tools=list(_NAV_SCREENSHOT_TOOLS),
                 max_turns=5,
                 permission_mode="bypassPermissions",
             )
@@ -6,6 +6,7 @@ Run directly to test: uv run python -m jira_agent.integrations.claude.claude_sdk
 """
 
 import asyncio
+import functools
 import sys
 import time
 from typing import Any
@@ -15,6 +16,7 @@ from jira_agent.integrations.base import (
     HealthCheckTier,
     HealthStatus,
     Integration,
+    _sdk_available,
 )
 
 
@@ -33,9 +35,7 @@ class ClaudeSDK(Integration):
         Returns:
             HealthCheckResult with status and details.
         """
-        try:
-            import claude_agent_sdk  # noqa: F401
-
+        if _sdk_available():
             return HealthCheckResult(
                 name=self.name,
                 status=HealthStatus.OK,
@@ -43,14 +43,24 @@ class ClaudeSDK(Integration):
                 duration_ms=0,
                 tier=HealthCheckTier.CONFIG,
             )
-        except ImportError:
-            return HealthCheckResult(
-                name=self.name,
-                status=HealthStatus.FAILED,
-                message="claude_agent_sdk not installed. Run: uv add claude-agent-sdk",
-                duration_ms=0,
-                tier=HealthCheckTier.CONFIG,
-            )
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.FAILED,
+            message="claude_agent_sdk not installed. Run: uv add claude-agent-sdk",
+            duration_ms=0,
+            tier=HealthCheckTier.CONFIG,
+        )
+
+    @functools.cached_property
+    def _health_check_options(self) -> Any:
+        """ClaudeAgentOptions for the health check, built once per instance."""
+        from claude_agent_sdk import ClaudeAgentOptions
+
+        return ClaudeAgentOptions(
+            allowed_tools=[],
+            max_turns=1,
+            permission_mode="bypassPermissions",
+        )
 
     async def check_health(self) -> HealthCheckResult:
         """Tier 2: Verify OAuth token by making a minimal SDK query.
@@ -64,20 +74,15 @@ class ClaudeSDK(Integration):
         if config_result.status != HealthStatus.OK:
             return config_result
 
-        start = time.monotonic()
+        start = time.monotonic_ns()
 
         try:
             from claude_agent_sdk import (
-                ClaudeAgentOptions,
                 ResultMessage,
                 query,
             )
 
-            options = ClaudeAgentOptions(
-                allowed_tools=[],
-                max_turns=1,
-                permission_mode="bypassPermissions",
-            )
+            options = self._health_check_options
 
             result: HealthCheckResult | None = None
 
@@ -86,67 +91,36 @@ class ClaudeSDK(Integration):
                 options=options,
             ):
                 if isinstance(message, ResultMessage):
-                    duration = int((time.monotonic() - start) * 1000)
                     if message.is_error:
                         error_text = str(message.result)
                         if "authentication" in error_text.lower() or "401" in error_text:
-                            result = HealthCheckResult(
-                                name=self.name,
-                                status=HealthStatus.FAILED,
-                                message="OAuth token expired. Run `/login` to re-authenticate",
-                                duration_ms=duration,
-                                tier=HealthCheckTier.CONNECTIVITY,
+                            result = self._mk_result(
+                                start,
+                                HealthStatus.FAILED,
+                                "OAuth token expired. Run `/login` to re-authenticate",
                             )
                         else:
-                            result = HealthCheckResult(
-                                name=self.name,
-                                status=HealthStatus.FAILED,
-                                message=f"Query failed: {message.result}",
-                                duration_ms=duration,
-                                tier=HealthCheckTier.CONNECTIVITY,
-                            )
+                            result = self._mk_result(start, HealthStatus.FAILED, f"Query failed: {message.result}")
                     else:
-                        result = HealthCheckResult(
-                            name=self.name,
-                            status=HealthStatus.OK,
-                            message="OAuth token valid",
-                            duration_ms=duration,
-                            tier=HealthCheckTier.CONNECTIVITY,
-                        )
+                        result = self._mk_result(start, HealthStatus.OK, "OAuth token valid")
                     break
 
             if result:
                 return result
 
-            duration = int((time.monotonic() - start) * 1000)
-            return HealthCheckResult(
-                name=self.name,
-                status=HealthStatus.FAILED,
-                message="Query completed without result",
-                duration_ms=duration,
-                tier=HealthCheckTier.CONNECTIVITY,
-            )
+            return self._mk_result(start, HealthStatus.FAILED, "Query completed without result")
 
         except Exception as e:
-            duration = int((time.monotonic() - start) * 1000)
             error_str = str(e).lower()
 
             if "authentication" in error_str or "401" in error_str or "unauthorized" in error_str:
-                return HealthCheckResult(
-                    name=self.name,
-                    status=HealthStatus.FAILED,
-                    message="OAuth token expired. Run `/login` to re-authenticate",
-                    duration_ms=duration,
-                    tier=HealthCheckTier.CONNECTIVITY,
+                return self._mk_result(
+                    start,
+                    HealthStatus.FAILED,
+                    "OAuth token expired. Run `/login` to re-authenticate",
                 )
 
-            return HealthCheckResult(
-                name=self.name,
-                status=HealthStatus.FAILED,
-                message=f"Exception: {type(e).__name__}: {e}",
-                duration_ms=duration,
-                tier=HealthCheckTier.CONNECTIVITY,
-            )
+            return self._mk_result(start, HealthStatus.FAILED, f"Exception: {type(e).__name__}: {e}")
 
     def get_mcp_config(self) -> dict[str, Any] | None:
         """Return MCP server config for agent, or None if not MCP-based.
@@ -1,17 +1,61 @@
 """Health checks for service connectivity using the integration registry."""
 
+import asyncio
+import atexit
+import threading
+from typing import Any
+from collections.abc import Coroutine
+
 import anyio
-from typing import TYPE_CHECKING
 
 from jira_agent.integrations.base import (
     HealthCheckResult,
-    HealthStatus,
     Integration,
     MCPIntegration,
 )
 
-if TYPE_CHECKING:
-    pass
+
+class _LoopThread:
+    """Event loop running on a background thread, reused across sync calls.
+
+    anyio.run() spins up a fresh loop (plus thread pool and asyncgen hooks)
+    per invocation; for long-lived processes that poll health checks this
+    keeps one loop alive and submits coroutines to it instead.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="jira-agent-health-loop",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the background loop and block for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def shutdown(self) -> None:
+        """Stop the loop and join the thread (registered via atexit)."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        self.loop.close()
+
+
+_loop_thread: _LoopThread | None = None
+_loop_thread_lock = threading.Lock()
+
+
+def _get_loop_thread() -> _LoopThread:
+    """Return the shared background loop, creating it on first use."""
+    global _loop_thread
+    if _loop_thread is None:
+        with _loop_thread_lock:
+            if _loop_thread is None:
+                _loop_thread = _LoopThread()
+                atexit.register(_loop_thread.shutdown)
+    return _loop_thread
 
 
 def get_all_integrations() -> list[Integration]:
@@ -45,10 +89,25 @@ def get_all_integrations() -> list[Integration]:
 def get_http_integrations() -> list[Integration]:
     """Return only HTTP-based integrations.
 
+    Imports only the non-MCP modules so the common `include_mcp=False` CLI
+    path never pays for the MCP submodule imports.
+
     Returns:
         List of HTTP integration instances.
     """
-    return [i for i in get_all_integrations() if not isinstance(i, MCPIntegration)]
+    from jira_agent.integrations.claude import ClaudeSDK
+    from jira_agent.integrations.jira.client import JiraClient
+
+    integrations: list[Integration] = []
+
+    try:
+        integrations.append(JiraClient())
+    except ValueError:
+        pass  # Skip if not configured
+
+    integrations.append(ClaudeSDK())
+
+    return integrations
 
 
 def get_mcp_integrations() -> list[MCPIntegration]:
@@ -57,7 +116,10 @@ def get_mcp_integrations() -> list[MCPIntegration]:
     Returns:
         List of MCP integration instances.
     """
-    return [i for i in get_all_integrations() if isinstance(i, MCPIntegration)]
+    from jira_agent.integrations.browser import BrowserMCP
+    from jira_agent.integrations.jira.jira_mcp import JiraMCP
+
+    return [JiraMCP(), BrowserMCP()]
 
 
 async def run_health_checks_async(
@@ -103,7 +165,7 @@ def run_health_checks(include_mcp: bool = False) -> list[HealthCheckResult]:
     Returns:
         List of health check results.
     """
-    return anyio.run(run_health_checks_async, include_mcp)
+    return _get_loop_thread().run(run_health_checks_async(include_mcp))
 
 
 def run_config_checks(include_mcp: bool = True) -> list[HealthCheckResult]:
@@ -150,11 +212,12 @@ def check_jira() -> HealthCheckResult:
     Uses direct HTTP calls to the Jira REST API.
     Requires JIRA_URL, JIRA_USERNAME, and JIRA_API_TOKEN env vars.
     """
+    from jira_agent.integrations.base import HealthStatus
     from jira_agent.integrations.jira import JiraClient
 
     try:
         client = JiraClient()
-        return anyio.run(client.check_health)
+        return _get_loop_thread().run(client.check_health())
     except ValueError as e:
         return HealthCheckResult(
             name="Jira HTTP",
@@ -168,6 +231,8 @@ def check_jira() -> HealthCheckResult:
 if __name__ == "__main__":
     import sys
 
+    from jira_agent.integrations.base import HealthStatus
+
     print("Integration Health Checks")
     print("=" * 60)
 
@@ -1,21 +1,27 @@
 """Jira integrations - HTTP and MCP implementations."""
 
 from jira_agent.integrations.jira.client import (
+    AsyncJiraClient,
     JiraClient,
     Ticket,
     check_jira_connection,
     fetch_ticket,
+    fetch_tickets,
     get_client,
+    reset_client,
 )
 from jira_agent.integrations.jira.jira_mcp import JiraMCP
 
 __all__ = [
     # HTTP client
+    "AsyncJiraClient",
     "JiraClient",
     "Ticket",
     "check_jira_connection",
     "fetch_ticket",
+    "fetch_tickets",
     "get_client",
+    "reset_client",
     # MCP integration
     "JiraMCP",
 ]
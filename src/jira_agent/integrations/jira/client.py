@@ -1,18 +1,35 @@
 """Jira API client using direct HTTP calls."""
 
 import asyncio
+import atexit
+import base64
 import os
+import threading
 import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import httpx
 
+try:  # Optional: 2-5x faster JSON decode on large ADF payloads
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:  # Optional: streaming JSON parse for very large tickets
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
 from jira_agent.integrations.base import (
     HealthCheckResult,
     HealthCheckTier,
     HealthStatus,
     HTTPIntegration,
 )
+from jira_agent.log import log
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,6 +42,199 @@ class Ticket:
     status: str
 
 
+# Only the fields Ticket actually uses; the default issue payload carries
+# dozens of KB of custom fields we would otherwise download and parse.
+_DEFAULT_ISSUE_FIELDS = "summary,description,issuetype,priority,status"
+
+# Transient statuses worth retrying: Jira Cloud rate limiting and gateway
+# hiccups. 429/503 responses usually carry a Retry-After header.
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 3
+
+# Short-lived issue cache: agent workflows re-fetch the same ticket across
+# steps, and a 30s window is well within how fast tickets actually change.
+_ISSUE_CACHE_TTL = 30.0
+_ISSUE_CACHE_MAX = 1024
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring Retry-After when present.
+
+    Args:
+        response: The 429/5xx response that triggered the retry
+        attempt: Zero-based retry attempt number
+
+    Returns:
+        Delay in seconds (exponential backoff fallback, capped at 30s).
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(2.0**attempt, 30.0)
+
+
+class _ResponseReader:
+    """Minimal file-like adapter over httpx streaming bytes for ijson."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            return self._buffer + b"".join(self._chunks)
+        while len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        out, self._buffer = self._buffer[:size], self._buffer[size:]
+        return out
+
+
+def _use_streaming() -> bool:
+    """Whether to parse issue responses incrementally off the wire."""
+    return ijson is not None and os.environ.get("JIRA_STREAM_LARGE") == "1"
+
+
+def _use_http2() -> bool:
+    """Whether to negotiate HTTP/2 (needs the h2 package via httpx[http2]).
+
+    Opt-in via JIRA_HTTP2=1: one HTTP/2 connection multiplexes many
+    in-flight GETs, which helps bursty batch fetches against Jira Cloud.
+    """
+    return os.environ.get("JIRA_HTTP2") == "1"
+
+
+def _decode_json(response: httpx.Response) -> dict:
+    """Decode a response body, preferring orjson when installed.
+
+    Args:
+        response: The httpx response to decode
+
+    Returns:
+        Decoded JSON payload
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _basic_auth_headers(username: str, api_token: str) -> dict[str, str]:
+    """Build request headers with a precomputed basic-auth value.
+
+    Args:
+        username: Jira username/email
+        api_token: Jira API token
+
+    Returns:
+        Headers dict with Authorization and Accept set.
+    """
+    credentials = base64.b64encode(f"{username}:{api_token}".encode()).decode()
+    return {
+        "Authorization": f"Basic {credentials}",
+        "Accept": "application/json",
+    }
+
+
+def _build_ticket(data: dict, issue_key: str) -> Ticket:
+    """Build a Ticket from an issue API payload.
+
+    Args:
+        data: Decoded JSON body from /rest/api/3/issue/{key}
+        issue_key: The requested issue key (fallback if missing from payload)
+
+    Returns:
+        Ticket with issue details
+    """
+    fields = data.get("fields", {})
+
+    # Extract description text from Atlassian Document Format
+    description = ""
+    desc_data = fields.get("description")
+    if desc_data:
+        description = _extract_text_from_adf(desc_data)
+
+    return Ticket(
+        key=data.get("key", issue_key),
+        summary=fields.get("summary", ""),
+        description=description,
+        issue_type=fields.get("issuetype", {}).get("name", "Unknown"),
+        priority=fields.get("priority", {}).get("name", "Unknown"),
+        status=fields.get("status", {}).get("name", "Unknown"),
+    )
+
+
+# ADF node handlers, dispatched by node type so the walker does a single
+# dict lookup per node instead of a chain of string comparisons.
+def _adf_text(node: dict, parts: list[str], stack: deque) -> None:
+    parts.append(node.get("text", ""))
+
+
+def _adf_hard_break(node: dict, parts: list[str], stack: deque) -> None:
+    if parts:  # suppress leading breaks
+        parts.append("\n")
+
+
+def _adf_paragraph(node: dict, parts: list[str], stack: deque) -> None:
+    stack.append("\n")  # emitted after the paragraph content
+    if (content := node.get("content")) is not None:
+        stack.extend(reversed(content))
+
+
+def _adf_default(node: dict, parts: list[str], stack: deque) -> None:
+    if (content := node.get("content")) is not None:
+        stack.extend(reversed(content))
+
+
+_ADF_HANDLERS = {
+    "text": _adf_text,
+    "hardBreak": _adf_hard_break,
+    "paragraph": _adf_paragraph,
+}
+
+
+def _extract_text_from_adf(adf: dict) -> str:
+    """Extract plain text from Atlassian Document Format.
+
+    Args:
+        adf: The ADF document structure
+
+    Returns:
+        Plain text representation
+    """
+    if not isinstance(adf, dict):
+        return str(adf) if adf else ""
+
+    # Iterative depth-first walk: no per-node call frames and no recursion
+    # depth limit on deeply nested documents. Strings pushed onto the stack
+    # are emitted verbatim, so "\n" doubles as the paragraph-break sentinel.
+    text_parts: list[str] = []
+    append = text_parts.append
+    get_handler = _ADF_HANDLERS.get
+    stack: deque[dict | list | str] = deque([adf])
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if node != "\n" or text_parts:  # suppress leading breaks
+                append(node)
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            get_handler(node.get("type"), _adf_default)(node, text_parts, stack)
+
+    # Trim trailing paragraph breaks in place rather than re-copying the
+    # whole joined string with .strip().
+    while text_parts and text_parts[-1] == "\n":
+        text_parts.pop()
+
+    return "".join(text_parts)
+
+
 class JiraClient(HTTPIntegration):
     """Client for Jira REST API."""
 
@@ -54,15 +264,126 @@ class JiraClient(HTTPIntegration):
         if not self.api_token:
             raise ValueError("JIRA_API_TOKEN environment variable not set")
 
+        # One pooled client per instance: reusing connections avoids paying
+        # TCP+TLS setup on every request. The Authorization header is
+        # precomputed so httpx never re-base64-encodes credentials per call.
+        self._auth = (self.username, self.api_token)
+        self._client = httpx.Client(
+            base_url=self.url,
+            headers=_basic_auth_headers(self.username, self.api_token),
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0),
+            http2=_use_http2(),
+        )
+
+        self._issue_cache: dict[str, tuple[float, Ticket]] = {}
+        self._cache_lock = threading.Lock()
+
     def _get_auth(self) -> tuple[str, str]:
         """Return basic auth tuple."""
-        return (self.username, self.api_token)
+        return self._auth
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def __enter__(self) -> "JiraClient":
+        return self
 
-    def get_issue(self, issue_key: str) -> Ticket:
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get_issue(self, issue_key: str, fields: str = _DEFAULT_ISSUE_FIELDS) -> Ticket:
         """Fetch a Jira issue by key.
 
         Args:
             issue_key: The issue key (e.g., SPE-123)
+            fields: Comma-separated field list to request (defaults to the
+                fields Ticket uses, which keeps payloads small)
+
+        Returns:
+            Ticket with issue details
+
+        Raises:
+            RuntimeError: If the API call fails after retries
+        """
+        # Only cache default-field fetches so overrides always hit the API.
+        cacheable = fields == _DEFAULT_ISSUE_FIELDS
+        if cacheable:
+            ticket = self._cache_get(issue_key)
+            if ticket is not None:
+                log.debug("issue cache hit: %s", issue_key)
+                return ticket
+            log.debug("issue cache miss: %s", issue_key)
+
+        if _use_streaming():
+            ticket = self._get_issue_streaming(issue_key, fields)
+            if cacheable:
+                self._cache_put(issue_key, ticket)
+            return ticket
+
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                response = self._client.get(f"/rest/api/3/issue/{issue_key}", params={"fields": fields})
+                response.raise_for_status()
+                data = _decode_json(response)
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code == 404:
+                    raise RuntimeError(f"Ticket {issue_key} not found") from e
+                if status_code in _RETRY_STATUS_CODES and attempt < _MAX_RETRIES:
+                    time.sleep(_retry_delay(e.response, attempt))
+                    continue
+                raise RuntimeError(f"Failed to fetch ticket {issue_key}: {e}") from e
+            except httpx.RequestError as e:
+                raise RuntimeError(f"Failed to connect to Jira: {e}") from e
+
+            ticket = _build_ticket(data, issue_key)
+            if cacheable:
+                self._cache_put(issue_key, ticket)
+            return ticket
+
+        raise RuntimeError(f"Failed to fetch ticket {issue_key}: retries exhausted")  # pragma: no cover
+
+    def _cache_get(self, issue_key: str) -> Ticket | None:
+        """Return a cached ticket if present and not expired."""
+        with self._cache_lock:
+            entry = self._issue_cache.get(issue_key)
+            if entry is None:
+                return None
+            expires, ticket = entry
+            if time.monotonic() >= expires:
+                del self._issue_cache[issue_key]
+                return None
+            return ticket
+
+    def _cache_put(self, issue_key: str, ticket: Ticket) -> None:
+        """Cache a ticket, evicting the oldest entry when full."""
+        with self._cache_lock:
+            if len(self._issue_cache) >= _ISSUE_CACHE_MAX:
+                self._issue_cache.pop(next(iter(self._issue_cache)))
+            self._issue_cache[issue_key] = (time.monotonic() + _ISSUE_CACHE_TTL, ticket)
+
+    def invalidate(self, issue_key: str) -> None:
+        """Drop a single ticket from the issue cache."""
+        with self._cache_lock:
+            self._issue_cache.pop(issue_key, None)
+
+    def clear_cache(self) -> None:
+        """Drop all cached tickets."""
+        with self._cache_lock:
+            self._issue_cache.clear()
+
+    def _get_issue_streaming(self, issue_key: str, fields: str) -> Ticket:
+        """Fetch an issue parsing the response incrementally off the wire.
+
+        Each field of `fields` is materialized one at a time (the ADF
+        description is converted to text and dropped immediately), so peak
+        memory is roughly one field instead of raw bytes plus the full tree.
+
+        Args:
+            issue_key: The issue key (e.g., SPE-123)
+            fields: Comma-separated field list to request
 
         Returns:
             Ticket with issue details
@@ -70,13 +391,31 @@ class JiraClient(HTTPIntegration):
         Raises:
             RuntimeError: If the API call fails
         """
-        api_url = f"{self.url}/rest/api/3/issue/{issue_key}"
+        summary = ""
+        description = ""
+        issue_type = priority = status = "Unknown"
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.get(api_url, auth=self._get_auth())
+            with self._client.stream(
+                "GET",
+                f"/rest/api/3/issue/{issue_key}",
+                params={"fields": fields},
+            ) as response:
                 response.raise_for_status()
-                data = response.json()
+                for name, value in ijson.kvitems(_ResponseReader(response), "fields"):
+                    if name == "summary":
+                        summary = value or ""
+                    elif name == "description":
+                        if value:
+                            description = _extract_text_from_adf(value)
+                    elif name in ("issuetype", "priority", "status") and value:
+                        label = value.get("name", "Unknown")
+                        if name == "issuetype":
+                            issue_type = label
+                        elif name == "priority":
+                            priority = label
+                        else:
+                            status = label
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 raise RuntimeError(f"Ticket {issue_key} not found") from e
@@ -84,21 +423,13 @@ class JiraClient(HTTPIntegration):
         except httpx.RequestError as e:
             raise RuntimeError(f"Failed to connect to Jira: {e}") from e
 
-        fields = data.get("fields", {})
-
-        # Extract description text from Atlassian Document Format
-        description = ""
-        desc_data = fields.get("description")
-        if desc_data:
-            description = self._extract_text_from_adf(desc_data)
-
         return Ticket(
-            key=data.get("key", issue_key),
-            summary=fields.get("summary", ""),
+            key=issue_key,
+            summary=summary,
             description=description,
-            issue_type=fields.get("issuetype", {}).get("name", "Unknown"),
-            priority=fields.get("priority", {}).get("name", "Unknown"),
-            status=fields.get("status", {}).get("name", "Unknown"),
+            issue_type=issue_type,
+            priority=priority,
+            status=status,
         )
 
     def _extract_text_from_adf(self, adf: dict) -> str:
@@ -110,35 +441,7 @@ class JiraClient(HTTPIntegration):
         Returns:
             Plain text representation
         """
-        if not isinstance(adf, dict):
-            return str(adf) if adf else ""
-
-        text_parts: list[str] = []
-
-        def extract_recursive(node: dict | list | str) -> None:
-            if isinstance(node, str):
-                text_parts.append(node)
-            elif isinstance(node, list):
-                for item in node:
-                    extract_recursive(item)
-            elif isinstance(node, dict):
-                # Handle text nodes
-                if node.get("type") == "text":
-                    text_parts.append(node.get("text", ""))
-                # Handle hard breaks
-                elif node.get("type") == "hardBreak":
-                    text_parts.append("\n")
-                # Handle paragraphs - add newline after
-                elif node.get("type") == "paragraph":
-                    if "content" in node:
-                        extract_recursive(node["content"])
-                    text_parts.append("\n")
-                # Recurse into content
-                elif "content" in node:
-                    extract_recursive(node["content"])
-
-        extract_recursive(adf)
-        return "".join(text_parts).strip()
+        return _extract_text_from_adf(adf)
 
     def _check_connection_sync(self) -> tuple[bool, str]:
         """Check if the Jira connection works (synchronous).
@@ -146,15 +449,12 @@ class JiraClient(HTTPIntegration):
         Returns:
             Tuple of (success, message)
         """
-        api_url = f"{self.url}/rest/api/3/myself"
-
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(api_url, auth=self._get_auth())
-                response.raise_for_status()
-                data = response.json()
-                display_name = data.get("displayName", "Unknown")
-                return True, f"Connected as {display_name}"
+            response = self._client.get("/rest/api/3/myself", timeout=10.0)
+            response.raise_for_status()
+            data = _decode_json(response)
+            display_name = data.get("displayName", "Unknown")
+            return True, f"Connected as {display_name}"
         except httpx.HTTPStatusError as e:
             return False, f"Auth failed: {e.response.status_code}"
         except httpx.RequestError as e:
@@ -171,13 +471,15 @@ class JiraClient(HTTPIntegration):
         start = time.monotonic()
 
         # Check required config (these should exist if __init__ succeeded)
-        missing = []
-        if not self.url:
-            missing.append("JIRA_URL")
-        if not self.username:
-            missing.append("JIRA_USERNAME")
-        if not self.api_token:
-            missing.append("JIRA_API_TOKEN")
+        missing = [
+            name
+            for name, value in (
+                ("JIRA_URL", self.url),
+                ("JIRA_USERNAME", self.username),
+                ("JIRA_API_TOKEN", self.api_token),
+            )
+            if not value
+        ]
 
         duration = int((time.monotonic() - start) * 1000)
 
@@ -205,9 +507,8 @@ class JiraClient(HTTPIntegration):
         start = time.monotonic()
 
         try:
-            # Run sync check in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            success, message = await loop.run_in_executor(None, self._check_connection_sync)
+            # Run sync check in a worker thread to avoid blocking the loop
+            success, message = await asyncio.to_thread(self._check_connection_sync)
             duration = int((time.monotonic() - start) * 1000)
 
             if success:
@@ -236,16 +537,151 @@ class JiraClient(HTTPIntegration):
             )
 
 
+class AsyncJiraClient:
+    """Async client for the Jira REST API.
+
+    Mirrors JiraClient but uses httpx.AsyncClient so callers can fetch many
+    issues concurrently on one event loop (e.g. hydrating JQL results or
+    epic children) instead of serializing N round trips.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        username: str | None = None,
+        api_token: str | None = None,
+    ) -> None:
+        """Initialize async Jira client.
+
+        Args:
+            url: Jira instance URL (default: JIRA_URL env var)
+            username: Jira username/email (default: JIRA_USERNAME env var)
+            api_token: Jira API token (default: JIRA_API_TOKEN env var)
+        """
+        self.url = (url or os.environ.get("JIRA_URL", "")).rstrip("/")
+        self.username = username or os.environ.get("JIRA_USERNAME", "")
+        self.api_token = api_token or os.environ.get("JIRA_API_TOKEN", "")
+
+        if not self.url:
+            raise ValueError("JIRA_URL environment variable not set")
+        if not self.username:
+            raise ValueError("JIRA_USERNAME environment variable not set")
+        if not self.api_token:
+            raise ValueError("JIRA_API_TOKEN environment variable not set")
+
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            headers=_basic_auth_headers(self.username, self.api_token),
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=20),
+            http2=_use_http2(),
+        )
+
+    async def get_issue(self, issue_key: str, fields: str = _DEFAULT_ISSUE_FIELDS) -> Ticket:
+        """Fetch a Jira issue by key.
+
+        Args:
+            issue_key: The issue key (e.g., SPE-123)
+            fields: Comma-separated field list to request (defaults to the
+                fields Ticket uses, which keeps payloads small)
+
+        Returns:
+            Ticket with issue details
+
+        Raises:
+            RuntimeError: If the API call fails after retries
+        """
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                response = await self._client.get(f"/rest/api/3/issue/{issue_key}", params={"fields": fields})
+                response.raise_for_status()
+                data = _decode_json(response)
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code == 404:
+                    raise RuntimeError(f"Ticket {issue_key} not found") from e
+                if status_code in _RETRY_STATUS_CODES and attempt < _MAX_RETRIES:
+                    await asyncio.sleep(_retry_delay(e.response, attempt))
+                    continue
+                raise RuntimeError(f"Failed to fetch ticket {issue_key}: {e}") from e
+            except httpx.RequestError as e:
+                raise RuntimeError(f"Failed to connect to Jira: {e}") from e
+
+            return _build_ticket(data, issue_key)
+
+        raise RuntimeError(f"Failed to fetch ticket {issue_key}: retries exhausted")  # pragma: no cover
+
+    async def get_issues(
+        self,
+        issue_keys: Iterable[str],
+        concurrency: int = 10,
+    ) -> list[Ticket | BaseException]:
+        """Fetch multiple issues concurrently.
+
+        Args:
+            issue_keys: Issue keys to fetch.
+            concurrency: Max in-flight requests (bounded by a semaphore).
+
+        Returns:
+            List of Tickets (or the exception raised for that key), in the
+            same order as issue_keys.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch(key: str) -> Ticket:
+            async with semaphore:
+                return await self.get_issue(key)
+
+        return await asyncio.gather(
+            *(_fetch(key) for key in issue_keys),
+            return_exceptions=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
 # Module-level convenience functions
-_client: JiraClient | None = None
+_clients: dict[tuple[str, str], JiraClient] = {}
+_clients_lock = threading.Lock()
 
 
 def get_client() -> JiraClient:
-    """Get or create the Jira client singleton."""
-    global _client
-    if _client is None:
-        _client = JiraClient()
-    return _client
+    """Get or create the Jira client singleton for the configured instance.
+
+    Clients are cached per (url, username) so tests and multi-tenant use
+    don't collide, and creation is double-check locked so a concurrent
+    first call (e.g. from fetch_tickets worker threads) can't build two
+    pools. Each pool is closed at interpreter exit.
+    """
+    key = (
+        os.environ.get("JIRA_URL", "").rstrip("/"),
+        os.environ.get("JIRA_USERNAME", ""),
+    )
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = JiraClient()
+                atexit.register(client.close)
+                _clients[key] = client
+    return client
+
+
+def reset_client() -> None:
+    """Drop and close all cached client singletons (primarily for tests)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
 
 
 def fetch_ticket(ticket_key: str) -> Ticket:
@@ -262,6 +698,32 @@ def fetch_ticket(ticket_key: str) -> Ticket:
     return get_client().get_issue(ticket_key)
 
 
+def fetch_tickets(ticket_keys: Sequence[str], max_workers: int | None = None) -> list[Ticket]:
+    """Fetch multiple Jira tickets in parallel.
+
+    The work is I/O-bound, so a thread pool over the shared pooled client
+    turns M sequential round trips into ~M/max_workers.
+
+    Args:
+        ticket_keys: Issue keys to fetch (e.g., ["SPE-123", "SPE-124"])
+        max_workers: Thread count (default: JIRA_BATCH_WORKERS env var or 10)
+
+    Returns:
+        List of Tickets in the same order as ticket_keys
+
+    Raises:
+        RuntimeError: If any fetch fails
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get("JIRA_BATCH_WORKERS", "10"))
+
+    client = get_client()  # shared connection pool across worker threads
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(client.get_issue, key) for key in ticket_keys]
+        return [future.result() for future in futures]
+
+
 def check_jira_connection() -> tuple[bool, str]:
     """Check if Jira connection works.
 
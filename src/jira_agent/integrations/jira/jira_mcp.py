@@ -14,6 +14,16 @@ from jira_agent.integrations.base import (
     MCPIntegration,
 )
 
+# Tool name constants, hoisted so hot paths don't rebuild the lists per call.
+_ALL_TOOLS = (
+    "mcp__atlassian__getJiraIssue",
+    "mcp__atlassian__getAccessibleAtlassianResources",
+    "mcp__atlassian__searchJiraIssuesUsingJql",
+    "mcp__atlassian__getJiraIssueComments",
+)
+_HEALTH_CHECK_TOOLS = ("mcp__atlassian__getAccessibleAtlassianResources",)
+_FETCH_TICKET_TOOLS = ("mcp__atlassian__getJiraIssue",)
+
 
 class JiraMCP(MCPIntegration):
     """Jira integration via Atlassian MCP server.
@@ -41,13 +51,8 @@ class JiraMCP(MCPIntegration):
         self.username = username or os.environ.get("JIRA_USERNAME", "")
         self.api_token = api_token or os.environ.get("JIRA_API_TOKEN", "")
 
-    def get_mcp_config(self) -> dict[str, Any]:
-        """Return MCP server configuration for the agent.
-
-        Returns:
-            Dict with MCP server configuration for Atlassian.
-        """
-        return {
+        # Config never changes after init, so build it once instead of per call.
+        self._mcp_config: dict[str, Any] = {
             "atlassian": {
                 "command": "docker",
                 "args": [
@@ -70,18 +75,21 @@ class JiraMCP(MCPIntegration):
             }
         }
 
-    def get_tools(self) -> list[str]:
-        """Return list of MCP tool names this integration provides.
+    def get_mcp_config(self) -> dict[str, Any]:
+        """Return MCP server configuration for the agent.
+
+        Returns:
+            Dict with MCP server configuration for Atlassian.
+        """
+        return self._mcp_config
+
+    def get_tools(self) -> tuple[str, ...]:
+        """Return the MCP tool names this integration provides.
 
         Returns:
-            List of Atlassian MCP tool names.
+            Tuple of Atlassian MCP tool names (shared constant, do not mutate).
         """
-        return [
-            "mcp__atlassian__getJiraIssue",
-            "mcp__atlassian__getAccessibleAtlassianResources",
-            "mcp__atlassian__searchJiraIssuesUsingJql",
-            "mcp__atlassian__getJiraIssueComments",
-        ]
+        return _ALL_TOOLS
 
     def check_config(self) -> HealthCheckResult:
         """Tier 1: Check configuration (env vars, imports). No network calls.
@@ -90,13 +98,15 @@ class JiraMCP(MCPIntegration):
             HealthCheckResult with status and details.
         """
         # Check required env vars
-        missing = []
-        if not self.url:
-            missing.append("JIRA_URL")
-        if not self.username:
-            missing.append("JIRA_USERNAME")
-        if not self.api_token:
-            missing.append("JIRA_API_TOKEN")
+        missing = [
+            name
+            for name, value in (
+                ("JIRA_URL", self.url),
+                ("JIRA_USERNAME", self.username),
+                ("JIRA_API_TOKEN", self.api_token),
+            )
+            if not value
+        ]
 
         if missing:
             return HealthCheckResult(
@@ -124,7 +134,7 @@ class JiraMCP(MCPIntegration):
 
     def _get_health_check_tools(self) -> list[str]:
         """Return the allowed tools for health check query."""
-        return ["mcp__atlassian__getAccessibleAtlassianResources"]
+        return list(_HEALTH_CHECK_TOOLS)
 
     # check_health() is inherited from MCPIntegration
     # Uses default max_turns=3 from base class
@@ -151,7 +161,7 @@ class JiraMCP(MCPIntegration):
 
             options = ClaudeAgentOptions(
                 mcp_servers=self.get_mcp_config(),
-                allowed_tools=["mcp__atlassian__getJiraIssue"],
+                allowed_tools=list(_FETCH_TICKET_TOOLS),
                 max_turns=5,
                 permission_mode="bypassPermissions",
             )
@@ -33,24 +33,13 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import logging
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import IO, ClassVar, override
 
-
-def _fmt_record(record: logging.LogRecord, format: str = "%Y-%m-%d %H:%M:%S") -> str:
-    """Format the timestamp of a log record.
-
-    Args:
-        record: The LogRecord whose timestamp to format.
-        format: The datetime format string (default: "%Y-%m-%d %H:%M:%S").
-
-    Returns:
-        The formatted timestamp as a string.
-    """
-    return datetime.fromtimestamp(record.created).strftime(format)
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 class AgentLogger:
@@ -137,29 +126,38 @@ class AgentLogger:
         """
         self._logger.addHandler(handler)
 
-    def debug(self, msg: str) -> None:
-        """Log debug message (verbose, for troubleshooting)."""
-        self._logger.debug(msg)
+    def debug(self, msg: str, *args: object) -> None:
+        """Log debug message (verbose, for troubleshooting).
 
-    def info(self, msg: str) -> None:
+        Pass %-style args (log.debug("payload: %s", payload)) so formatting
+        only happens when the record is actually emitted.
+        """
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(msg, *args)
+
+    def info(self, msg: str, *args: object) -> None:
         """Log info message (normal operation)."""
-        self._logger.info(msg)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(msg, *args)
 
-    def warn(self, msg: str) -> None:
+    def warn(self, msg: str, *args: object) -> None:
         """Log warning message (unexpected but recoverable)."""
-        self._logger.warning(msg)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(msg, *args)
 
-    def error(self, msg: str) -> None:
+    def error(self, msg: str, *args: object) -> None:
         """Log error message (failure)."""
-        self._logger.error(msg)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(msg, *args)
 
-    def critical(self, msg: str) -> None:
+    def critical(self, msg: str, *args: object) -> None:
         """Log critical message (system failure)."""
-        self._logger.critical(msg)
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(msg, *args)
 
-    def exception(self, msg: str) -> None:
+    def exception(self, msg: str, *args: object) -> None:
         """Log error with exception traceback."""
-        self._logger.exception(msg)
+        self._logger.exception(msg, *args)
 
 
 class AgentFormatter(logging.Formatter):
@@ -198,9 +196,15 @@ class AgentFormatter(logging.Formatter):
         """Format the log record."""
         parts: list[str] = []
 
-        # Timestamp for file logs
+        # Timestamp for file logs. formatTime uses time.localtime directly
+        # (no datetime object per record); cache on the record so multiple
+        # handlers formatting the same record don't recompute it.
         if self.include_timestamp:
-            parts.append(f"[{_fmt_record(record)}]")
+            asctime = record.__dict__.get("asctime")
+            if asctime is None:
+                asctime = self.formatTime(record, _TIMESTAMP_FORMAT)
+                record.asctime = asctime
+            parts.append(f"[{asctime}]")
 
         # Level indicator
         level_char = record.levelname[0]  # D, I, W, E, C
@@ -228,19 +232,44 @@ class OutputWriter:
     """
 
     _streams: list[IO[str]]
+    _flush_streams: list[IO[str]]
+    _owned_files: list[IO[str]]
 
     def __init__(self) -> None:
         self._streams = [sys.stdout]
+        # Only ttys need a flush per message (interactive feedback); file
+        # streams rely on Python's buffering to avoid a syscall per line.
+        self._flush_streams = [sys.stdout] if sys.stdout.isatty() else []
+        # Files opened by add_file; closed at exit so buffered lines aren't
+        # lost and long-running agents don't leak file descriptors.
+        self._owned_files = []
+        atexit.register(self.close)
 
     def add_file(self, path: str | Path) -> None:
         """Add a file to write output to (in addition to stdout)."""
-        self._streams.append(open(path, "a"))  # noqa: SIM115
+        stream = open(path, "a", buffering=8192)  # noqa: SIM115 - closed in close()
+        self._streams.append(stream)
+        self._owned_files.append(stream)
+
+    def close(self) -> None:
+        """Flush and close file streams opened via add_file (never stdout)."""
+        for stream in self._owned_files:
+            if not stream.closed:
+                stream.close()
+            self._streams.remove(stream)
+        self._owned_files.clear()
 
     def write(self, *args: object, sep: str = " ", end: str = "\n") -> None:
         """Write output to all streams (like print)."""
         message = sep.join(str(arg) for arg in args) + end
         for stream in self._streams:
             _ = stream.write(message)
+        for stream in self._flush_streams:
+            stream.flush()
+
+    def flush(self) -> None:
+        """Flush all streams (buffered file sinks included)."""
+        for stream in self._streams:
             stream.flush()
 
     def __call__(self, *args: object, sep: str = " ", end: str = "\n") -> None:
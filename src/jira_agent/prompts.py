@@ -7,39 +7,34 @@ Prompts are functions that accept codebase context, enabling:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import hashlib
+import json
+from typing import Protocol
 
-if TYPE_CHECKING:
-    from jira_agent.integrations import Ticket
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional perf dependency
+    orjson = None  # type: ignore[assignment]
 
 
-def build_ticket_prompt(ticket: Ticket, additional_info: str | None = None) -> str:
-    """Build the prompt for fixing a Jira ticket.
-
-    Args:
-        ticket: The Jira ticket to implement.
-        additional_info: Optional additional context from --info.file/--info.text.
+class _TicketLike(Protocol):
+    """The duck-typed ticket shape build_ticket_prompt actually uses.
 
-    Returns:
-        Complete prompt with ticket info and optional additional context.
+    Keeps this module importable without pulling in the integrations
+    package; any object with these attributes (e.g. integrations.Ticket)
+    satisfies it.
     """
-    base_prompt = f"""Fix this Jira ticket:
-
-# {ticket.key}: {ticket.summary}
-
-Type: {ticket.issue_type}
-Priority: {ticket.priority}
 
-## Description
-{ticket.description or "(no description)"}"""
-
-    if additional_info:
-        base_prompt += f"""
+    key: str
+    summary: str
+    issue_type: str
+    priority: str
+    description: str | None
 
-## Additional Context
-{additional_info}"""
 
-    base_prompt += """
+# Static prefix of the ticket prompt, interned once at import time.
+_TICKET_PROMPT_HEAD = """Fix the Jira ticket described below.
 
 ## Instructions
 
@@ -47,21 +42,58 @@ Priority: {ticket.priority}
 2. Then implement all the changes following the plan.
 3. Finally, use the 'verifier' subagent to check your work is complete.
 
-Start by invoking the planner subagent."""
+Start by invoking the planner subagent.
 
-    return base_prompt
+## Ticket
 
+"""
 
-def get_planner_prompt(codebase_context: str, codebase_name: str = "target") -> str:
-    """Build the planner prompt with codebase context.
+_TICKET_FIELDS_TMPL = """# {key}: {summary}
+
+Type: {issue_type}
+Priority: {priority}
+
+## Description
+{description}"""
+
+_ADDITIONAL_CONTEXT_TMPL = """
+
+## Additional Context
+{additional_info}"""
+
+
+def build_ticket_prompt(ticket: _TicketLike, additional_info: str | None = None) -> str:
+    """Build the prompt for fixing a Jira ticket.
+
+    The instruction block is ticket-independent, so it comes first: provider
+    prompt caches reuse the longest byte-identical prefix, and keeping the
+    volatile ticket fields at the tail means only the tail misses the cache.
+    Assembly is a single join over template pieces rather than repeated
+    str += concatenation.
 
     Args:
-        codebase_context: The loaded AGENT.md content.
+        ticket: The Jira ticket to implement.
+        additional_info: Optional additional context from --info.file/--info.text.
 
     Returns:
-        Complete planner prompt with context embedded.
+        Complete prompt with ticket info and optional additional context.
     """
-    return f"""You are a planning specialist for the {codebase_name} codebase.
+    parts = [
+        _TICKET_PROMPT_HEAD,
+        _TICKET_FIELDS_TMPL.format(
+            key=ticket.key,
+            summary=ticket.summary,
+            issue_type=ticket.issue_type,
+            priority=ticket.priority,
+            description=ticket.description or "(no description)",
+        ),
+    ]
+    if additional_info:
+        parts.append(_ADDITIONAL_CONTEXT_TMPL.format(additional_info=additional_info))
+    return "".join(parts)
+
+
+_PLANNER_TMPL = """You are a planning specialist for the {codebase_name} codebase.
 
 Your job is to analyze a Jira ticket and create a comprehensive implementation plan.
 
@@ -86,17 +118,7 @@ Provide a structured plan with:
 Be thorough. Missing files means incomplete implementation.
 """
 
-
-def get_verifier_prompt(codebase_context: str, codebase_name: str = "target") -> str:
-    """Build the verifier prompt with codebase context.
-
-    Args:
-        codebase_context: The loaded AGENT.md content.
-
-    Returns:
-        Complete verifier prompt with context embedded.
-    """
-    return f"""You are a verification specialist for the {codebase_name} codebase.
+_VERIFIER_TMPL = """You are a verification specialist for the {codebase_name} codebase.
 
 Your job is to verify that an implementation is complete and correct.
 
@@ -118,17 +140,7 @@ Report on:
 - Overall completeness assessment (complete/partial/incomplete)
 """
 
-
-def get_implementation_prompt(codebase_context: str, codebase_name: str = "target") -> str:
-    """Build the implementation prompt with codebase context.
-
-    Args:
-        codebase_context: The loaded AGENT.md content.
-
-    Returns:
-        Complete implementation prompt with context embedded.
-    """
-    return f"""You are an expert software engineer implementing Jira tickets for the {codebase_name} codebase.
+_IMPLEMENTATION_TMPL = """You are an expert software engineer implementing Jira tickets for the {codebase_name} codebase.
 
 {codebase_context}
 
@@ -156,18 +168,7 @@ def get_implementation_prompt(codebase_context: str, codebase_name: str = "targe
 - Don't forget test files!
 """
 
-
-def get_browser_verifier_prompt(codebase_context: str, base_url: str, codebase_name: str = "target") -> str:
-    """Build the browser verifier prompt with codebase context.
-
-    Args:
-        codebase_context: The loaded AGENT.md content.
-        base_url: The base URL of the deployed application.
-
-    Returns:
-        Complete browser verifier prompt with context embedded.
-    """
-    return f"""You are a browser verification specialist for the {codebase_name} codebase.
+_BROWSER_VERIFIER_TMPL = """You are a browser verification specialist for the {codebase_name} codebase.
 
 Your job is to verify that a code change works correctly in the deployed application.
 
@@ -195,6 +196,115 @@ Report on:
 """
 
 
+# Role name -> full template. One factory serves every role so there is a
+# single cached code path and no per-role function bodies to keep in sync.
+_ROLE_TMPLS = {
+    "planner": _PLANNER_TMPL,
+    "verifier": _VERIFIER_TMPL,
+    "implementation": _IMPLEMENTATION_TMPL,
+    "browser_verifier": _BROWSER_VERIFIER_TMPL,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_role_prompt(
+    role: str,
+    codebase_context: str,
+    codebase_name: str = "target",
+    base_url: str | None = None,
+) -> str:
+    """Build a role prompt from its template, memoized per argument tuple.
+
+    Args:
+        role: Key into _ROLE_TMPLS.
+        codebase_context: The loaded AGENT.md content.
+        codebase_name: Name of the target codebase.
+        base_url: Deployed app URL (browser_verifier only).
+
+    Returns:
+        Complete role prompt with context embedded.
+    """
+    return _ROLE_TMPLS[role].format_map(
+        {"codebase_context": codebase_context, "codebase_name": codebase_name, "base_url": base_url}
+    )
+
+
+def get_planner_prompt(codebase_context: str, codebase_name: str = "target") -> str:
+    """Build the planner prompt with codebase context.
+
+    Args:
+        codebase_context: The loaded AGENT.md content.
+
+    Returns:
+        Complete planner prompt with context embedded.
+    """
+    return _build_role_prompt("planner", codebase_context, codebase_name)
+
+
+def get_verifier_prompt(codebase_context: str, codebase_name: str = "target") -> str:
+    """Build the verifier prompt with codebase context.
+
+    Args:
+        codebase_context: The loaded AGENT.md content.
+
+    Returns:
+        Complete verifier prompt with context embedded.
+    """
+    return _build_role_prompt("verifier", codebase_context, codebase_name)
+
+
+def get_implementation_prompt(codebase_context: str, codebase_name: str = "target") -> str:
+    """Build the implementation prompt with codebase context.
+
+    Args:
+        codebase_context: The loaded AGENT.md content.
+
+    Returns:
+        Complete implementation prompt with context embedded.
+    """
+    return _build_role_prompt("implementation", codebase_context, codebase_name)
+
+
+def get_browser_verifier_prompt(codebase_context: str, base_url: str, codebase_name: str = "target") -> str:
+    """Build the browser verifier prompt with codebase context.
+
+    Args:
+        codebase_context: The loaded AGENT.md content.
+        base_url: The base URL of the deployed application.
+
+    Returns:
+        Complete browser verifier prompt with context embedded.
+    """
+    return _build_role_prompt("browser_verifier", codebase_context, codebase_name, base_url)
+
+
+@functools.lru_cache(maxsize=None)
+def prompt_hash(prompt: str) -> str:
+    """Return a short, deterministic content hash for a prompt.
+
+    Gives downstream caches (provider prompt caches, local KV/semantic
+    caches) a stable key for the static prompt text instead of comparing
+    the full string. Memoized, so repeated lookups for the same cached
+    prompt are O(1) after the first call.
+
+    Args:
+        prompt: The prompt text to hash.
+
+    Returns:
+        16-character blake2b hex digest of the prompt.
+    """
+    return hashlib.blake2b(prompt.encode(), digest_size=8).hexdigest()
+
+
+def clear_caches() -> None:
+    """Clear the memoized prompt caches.
+
+    Useful in tests that monkeypatch codebase context between cases.
+    """
+    _build_role_prompt.cache_clear()
+    prompt_hash.cache_clear()
+
+
 # Structured output schema for agent results
 RESULT_SCHEMA = {
     "type": "object",
@@ -255,3 +365,16 @@ BROWSER_VERIFICATION_SCHEMA = {
     },
     "required": ["url_visited", "observed", "confidence"],
 }
+
+
+def _dumps(schema: dict) -> bytes:
+    """Serialize a schema dict to compact JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(schema)
+    return json.dumps(schema, separators=(",", ":")).encode()
+
+
+# Pre-serialized schema bytes for callers that put the schema on the wire
+# themselves; serialized once at import instead of json.dumps per request.
+RESULT_SCHEMA_JSON = _dumps(RESULT_SCHEMA)
+BROWSER_VERIFICATION_SCHEMA_JSON = _dumps(BROWSER_VERIFICATION_SCHEMA)
@@ -1,5 +1,7 @@
 """Agent summary markdown generation."""
 
+import os
+import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -40,74 +42,73 @@ def generate_summary(ctx: SummaryContext, options: SummaryOptions) -> str:
     Returns:
         Markdown string with the summary content.
     """
+    # All parts accumulate in one list joined at the end; append is bound
+    # once since it runs for every line of the summary.
     lines: list[str] = []
+    append = lines.append
 
     # Header
-    lines.append(f"# Agent Summary: {ctx.ticket.key}")
-    lines.append("")
+    append(f"# Agent Summary: {ctx.ticket.key}")
+    append("")
 
     # Ticket section
-    lines.append("## Ticket")
-    lines.append(f"**{ctx.ticket.key}**: {ctx.ticket.summary}")
-    lines.append("")
+    append("## Ticket")
+    append(f"**{ctx.ticket.key}**: {ctx.ticket.summary}")
+    append("")
 
     # Implementation section
-    lines.append("## Implementation")
-    lines.append(ctx.result.summary)
-    lines.append("")
+    append("## Implementation")
+    append(ctx.result.summary)
+    append("")
 
     # Files Changed section
     if ctx.result.files:
-        lines.append(f"## Files Changed ({len(ctx.result.files)})")
-        for f in ctx.result.files:
-            # Make path relative if it starts with worktree path
-            rel_path = f
-            worktree_str = str(ctx.worktree_path)
-            if f.startswith(worktree_str):
-                rel_path = f[len(worktree_str) :].lstrip("/")
-            lines.append(f"- {rel_path}")
-        lines.append("")
+        append(f"## Files Changed ({len(ctx.result.files)})")
+        # One worktree prefix for all files: removeprefix makes the path
+        # relative when it lives under the worktree and is a no-op otherwise.
+        prefix = str(ctx.worktree_path).rstrip("/") + "/"
+        lines.extend(f"- {f.removeprefix(prefix)}" for f in ctx.result.files)
+        append("")
 
     # Status section
-    lines.append("## Status")
+    append("## Status")
     if ctx.result.success:
         verification = ctx.result.verification_status
         if verification == "complete":
-            lines.append("Complete")
+            append("Complete")
         elif verification == "partial":
-            lines.append("Partial")
+            append("Partial")
         else:
-            lines.append("Done")
+            append("Done")
     else:
-        lines.append("Failed")
-    lines.append("")
+        append("Failed")
+    append("")
 
     # Remaining Work section
-    lines.append("## Remaining Work")
+    append("## Remaining Work")
     if ctx.result.remaining_work:
-        for item in ctx.result.remaining_work:
-            lines.append(f"- {item}")
+        lines.extend(f"- {item}" for item in ctx.result.remaining_work)
     else:
-        lines.append("(none)")
-    lines.append("")
+        append("(none)")
+    append("")
 
     # Optional Metadata section
     if options.include_metadata:
-        lines.append("---")
-        lines.append("## Metadata")
+        append("---")
+        append("## Metadata")
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        lines.append(f"- **Generated**: {timestamp}")
-        lines.append(f"- **Duration**: {ctx.duration_seconds}s")
-        lines.append(f"- **Worktree**: {ctx.worktree_path}")
+        append(f"- **Generated**: {timestamp}")
+        append(f"- **Duration**: {ctx.duration_seconds}s")
+        append(f"- **Worktree**: {ctx.worktree_path}")
         if ctx.branch_name:
-            lines.append(f"- **Branch**: {ctx.branch_name}")
-        lines.append(f"- **Ticket Type**: {ctx.ticket.issue_type}")
-        lines.append(f"- **Ticket Priority**: {ctx.ticket.priority}")
+            append(f"- **Branch**: {ctx.branch_name}")
+        append(f"- **Ticket Type**: {ctx.ticket.issue_type}")
+        append(f"- **Ticket Priority**: {ctx.ticket.priority}")
         # Construct ticket URL
         ticket_url = f"{ctx.jira_url.rstrip('/')}/browse/{ctx.ticket.key}"
-        lines.append(f"- **Ticket URL**: {ticket_url}")
-        lines.append(f"- **Context File**: {ctx.context_file}")
-        lines.append("")
+        append(f"- **Ticket URL**: {ticket_url}")
+        append(f"- **Context File**: {ctx.context_file}")
+        append("")
 
     return "\n".join(lines)
 
@@ -123,20 +124,21 @@ def _version_existing_summary(path: Path) -> None:
     if not path.exists():
         return
 
-    # Find next available version number
-    version = 1
-    parent = path.parent
+    # Find the highest existing version in one directory scan instead of
+    # probing version numbers with exists() until one is free.
     stem = path.stem  # e.g., "AGENT_SUMMARY"
     suffix = path.suffix  # e.g., ".md"
+    version_re = re.compile(rf"{re.escape(stem)}\.(\d+){re.escape(suffix)}$")
 
-    while True:
-        versioned_path = parent / f"{stem}.{version}{suffix}"
-        if not versioned_path.exists():
-            break
-        version += 1
+    max_version = 0
+    with os.scandir(path.parent) as entries:
+        for entry in entries:
+            match = version_re.match(entry.name)
+            if match:
+                max_version = max(max_version, int(match.group(1)))
 
-    # Rename current file to versioned name
-    path.rename(versioned_path)
+    # Rename current file to the next versioned name
+    path.rename(path.with_name(f"{stem}.{max_version + 1}{suffix}"))
 
 
 def _get_output_path(
@@ -164,13 +166,10 @@ def _get_output_path(
             # Default to contexts/ in current working directory
             contexts_dir = Path.cwd() / "contexts"
 
-        # Extract repo name from worktree path
-        repo_name = ctx.worktree_path.name
-
-        summary_dir = contexts_dir / repo_name / ctx.ticket.key
-        summary_dir.mkdir(parents=True, exist_ok=True)
-
-        return summary_dir / "AGENT_SUMMARY.md"
+        # Join as strings and build one Path at the end instead of
+        # allocating an intermediate PurePath per / operator; the
+        # directory is created by write_summary, not here.
+        return Path(os.path.join(str(contexts_dir), ctx.worktree_path.name, ctx.ticket.key, "AGENT_SUMMARY.md"))
 
     # Default: worktree root
     return ctx.worktree_path / "AGENT_SUMMARY.md"
@@ -197,9 +196,10 @@ def write_summary(
     if options.to_contexts:
         _version_existing_summary(output_path)
 
-    # Generate and write content
+    # Generate and write content in one binary write: encoding up front
+    # skips TextIOWrapper buffering and newline translation.
     content = generate_summary(ctx, options)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content)
+    output_path.write_bytes(content.encode("utf-8"))
 
     return output_path
@@ -3,8 +3,10 @@
 Validates inputs early to fail fast with clear error messages.
 """
 
+import functools
 import os
 import re
+import stat
 import subprocess
 from pathlib import Path
 
@@ -12,12 +14,15 @@ from pathlib import Path
 # Allows uppercase letters and digits in project prefix
 TICKET_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9]*-\d+$")
 
-# Required environment variables for operation
-REQUIRED_ENV_VARS = [
+# Bound match method: skips the attribute lookup per call in the hot validator
+_ticket_key_match = TICKET_KEY_PATTERN.match
+
+# Required environment variables for operation (immutable, shared)
+REQUIRED_ENV_VARS = (
     "JIRA_URL",
     "JIRA_USERNAME",
     "JIRA_API_TOKEN",
-]
+)
 
 
 class ValidationError(Exception):
@@ -26,6 +31,22 @@ class ValidationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1024)
+def _ticket_key_error(key: str) -> str | None:
+    """Return the validation error message for a ticket key, or None if valid.
+
+    Memoized so re-validating the same key (CLI dispatch, agent retries)
+    is a cache hit; exceptions can't be cached directly, the message can.
+    """
+    if not key:
+        return "Ticket key cannot be empty"
+
+    if _ticket_key_match(key) is None:
+        return f"Invalid ticket key format: '{key}'. Expected format: PROJECT-123 (uppercase letters, hyphen, number)"
+
+    return None
+
+
 def validate_ticket_key(key: str) -> None:
     """Validate ticket key format.
 
@@ -42,13 +63,9 @@ def validate_ticket_key(key: str) -> None:
         >>> validate_ticket_key("spe-123")  # Raises ValidationError
         >>> validate_ticket_key("SPE123")  # Raises ValidationError
     """
-    if not key:
-        raise ValidationError("Ticket key cannot be empty")
-
-    if not TICKET_KEY_PATTERN.match(key):
-        raise ValidationError(
-            f"Invalid ticket key format: '{key}'. Expected format: PROJECT-123 (uppercase letters, hyphen, number)"
-        )
+    error = _ticket_key_error(key)
+    if error is not None:
+        raise ValidationError(error)
 
 
 def validate_env_vars() -> None:
@@ -57,11 +74,7 @@ def validate_env_vars() -> None:
     Raises:
         ValidationError: If any required env var is missing or empty.
     """
-    missing = []
-    for var in REQUIRED_ENV_VARS:
-        value = os.environ.get(var, "").strip()
-        if not value:
-            missing.append(var)
+    missing = [var for var in REQUIRED_ENV_VARS if not os.environ.get(var, "").strip()]
 
     if missing:
         raise ValidationError(
@@ -115,21 +128,42 @@ def validate_git_state(repo: Path) -> None:
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _validate_repo_path_cached(path: str) -> None:
+    """Validate a repo path, caching successes by path string.
+
+    Failures raise and are not cached (a repo that doesn't exist yet may
+    be created later); re-validating a known-good repo is a dict hit.
+    """
+    # One stat answers both "exists" and "is a directory" (exists() +
+    # is_dir() each stat separately); .git may be a file in worktrees,
+    # so only its presence is probed.
+    try:
+        st = os.stat(path)
+    except OSError:
+        raise ValidationError(f"Repository path does not exist: {path}") from None
+
+    if not stat.S_ISDIR(st.st_mode):
+        raise ValidationError(f"Repository path is not a directory: {path}")
+
+    if not os.access(os.path.join(path, ".git"), os.F_OK):
+        raise ValidationError(f"Not a git repository: {path}")
+
+
 def validate_repo_path(path: Path) -> None:
     """Validate that the repository path exists and is a git repo.
 
+    Successful validations are cached per path string, so re-validating
+    the same repo across code paths costs one lookup.
+
     Args:
         path: Path to validate.
 
     Raises:
         ValidationError: If path doesn't exist or isn't a git repo.
     """
-    if not path.exists():
-        raise ValidationError(f"Repository path does not exist: {path}")
+    _validate_repo_path_cached(os.fspath(path))
 
-    if not path.is_dir():
-        raise ValidationError(f"Repository path is not a directory: {path}")
 
-    git_dir = path / ".git"
-    if not git_dir.exists():
-        raise ValidationError(f"Not a git repository: {path}")
+# Let tests and long-running callers invalidate cached validations
+validate_repo_path.cache_clear = _validate_repo_path_cached.cache_clear  # type: ignore[attr-defined]
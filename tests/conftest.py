@@ -1 +1,29 @@
 """Shared test fixtures and configuration."""
+
+import pytest
+
+from jira_agent.integrations.browser import BrowserMCP
+from jira_agent.integrations.claude import ClaudeSDK
+from jira_agent.integrations.jira import JiraMCP
+
+# Integration construction is env-var and config plumbing that never changes
+# between tests, so one instance per session is shared by every test that
+# does not mutate the environment; env-var tests construct their own.
+
+
+@pytest.fixture(scope="session")
+def jira_mcp() -> JiraMCP:
+    """Shared JiraMCP instance with valid test credentials."""
+    return JiraMCP(url="https://test.atlassian.net", username="test", api_token="token")
+
+
+@pytest.fixture(scope="session")
+def browser_mcp() -> BrowserMCP:
+    """Shared BrowserMCP instance (no required env vars)."""
+    return BrowserMCP()
+
+
+@pytest.fixture(scope="session")
+def claude_sdk() -> ClaudeSDK:
+    """Shared ClaudeSDK instance."""
+    return ClaudeSDK()
@@ -1,6 +1,5 @@
 """Tests for context module functions."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -61,18 +60,14 @@ class TestGetContextPathForRepo:
 class TestLoadContext:
     """Tests for the load_context function."""
 
-    def test_loads_existing_file(self):
+    def test_loads_existing_file(self, tmp_path):
         """Successfully loads content from existing file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Test Content\nHello world")
-            path = Path(f.name)
+        path = tmp_path / "ctx.md"
+        path.write_text("# Test Content\nHello world")
 
-        try:
-            content = load_context(path)
-            assert "# Test Content" in content
-            assert "Hello world" in content
-        finally:
-            path.unlink()
+        content = load_context(path)
+        assert "# Test Content" in content
+        assert "Hello world" in content
 
     def test_raises_for_missing_file(self):
         """Raises FileNotFoundError for non-existent file."""
@@ -86,15 +81,12 @@ class TestLoadContext:
 class TestContextExists:
     """Tests for the context_exists function."""
 
-    def test_returns_true_for_existing_file(self):
+    def test_returns_true_for_existing_file(self, tmp_path):
         """Returns True when file exists."""
-        with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as f:
-            path = Path(f.name)
+        path = tmp_path / "x.md"
+        path.touch()
 
-        try:
-            assert context_exists(path) is True
-        finally:
-            path.unlink()
+        assert context_exists(path) is True
 
     def test_returns_false_for_missing_file(self):
         """Returns False when file doesn't exist."""
@@ -102,18 +94,23 @@ class TestContextExists:
         assert context_exists(path) is False
 
 
+@pytest.fixture(scope="module")
+def basic_header() -> str:
+    """One basic-mode header shared by the substring assertions below."""
+    return _build_metadata_header(Path("/repo"), deep=False, line_count=100)
+
+
 class TestBuildMetadataHeader:
     """Tests for the metadata header generation."""
 
-    def test_contains_generated_timestamp(self):
-        """Header contains Generated: timestamp."""
-        header = _build_metadata_header(Path("/repo"), deep=False, line_count=100)
-        assert "Generated:" in header
+    @pytest.mark.parametrize("needle", ["Generated:", "Mode: basic", "-->"])
+    def test_basic_header_contains(self, basic_header: str, needle: str):
+        """Basic-mode header contains the expected markers."""
+        assert needle in basic_header
 
-    def test_contains_mode_basic(self):
-        """Header contains Mode: basic for non-deep."""
-        header = _build_metadata_header(Path("/repo"), deep=False, line_count=100)
-        assert "Mode: basic" in header
+    def test_is_html_comment(self, basic_header: str):
+        """Header is wrapped in HTML comment."""
+        assert basic_header.startswith("<!--")
 
     def test_contains_mode_deep(self):
         """Header contains Mode: deep for deep=True."""
@@ -129,9 +126,3 @@ class TestBuildMetadataHeader:
         """Header contains Lines: count."""
         header = _build_metadata_header(Path("/repo"), deep=False, line_count=1500)
         assert "Lines: 1500" in header
-
-    def test_is_html_comment(self):
-        """Header is wrapped in HTML comment."""
-        header = _build_metadata_header(Path("/repo"), deep=False, line_count=100)
-        assert header.startswith("<!--")
-        assert "-->" in header
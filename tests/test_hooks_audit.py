@@ -1,13 +1,24 @@
 """Tests for audit hook."""
 
+import asyncio
+import functools
+import io
 import json
+from dataclasses import asdict
 from pathlib import Path
 
-import pytest
+import tyro
 
+from jira_agent.cli import Args, RunArgs
 from jira_agent.hooks.audit import AuditEntry, AuditLogger, make_audit_hook
 
 
+@functools.lru_cache(maxsize=None)
+def _parse(argv: tuple[str, ...]):
+    """Run tyro.cli once per distinct argv; the schema build dominates."""
+    return tyro.cli(Args, args=list(argv))
+
+
 class TestAuditEntry:
     """Tests for AuditEntry dataclass."""
 
@@ -24,8 +35,8 @@ class TestAuditEntry:
         assert entry.arguments == {"file_path": "/test/file.py"}
         assert entry.duration_ms is None
 
-    def test_to_json(self):
-        """Convert entry to JSON."""
+    def test_fields_set(self):
+        """Fields are stored as given."""
         entry = AuditEntry(
             timestamp="2024-01-01T00:00:00Z",
             tool_name="Read",
@@ -34,21 +45,30 @@ class TestAuditEntry:
             duration_ms=42,
         )
 
-        json_str = entry.to_json()
-        data = json.loads(json_str)
+        assert entry.tool_name == "Read"
+        assert entry.duration_ms == 42
+        assert entry.arguments["file_path"] == "/test/file.py"
+
+    def test_to_json_parses(self):
+        """to_json round-trips to the asdict() representation."""
+        entry = AuditEntry(
+            timestamp="2024-01-01T00:00:00Z",
+            tool_name="Read",
+            tool_use_id="abc123",
+            arguments={"file_path": "/test/file.py"},
+            duration_ms=42,
+        )
 
-        assert data["tool_name"] == "Read"
-        assert data["duration_ms"] == 42
-        assert data["arguments"]["file_path"] == "/test/file.py"
+        assert json.loads(entry.to_json()) == asdict(entry)
 
 
 class TestAuditLogger:
     """Tests for AuditLogger class."""
 
-    def test_log_tool_start(self, tmp_path):
+    def test_log_tool_start(self):
         """Log a tool call start."""
-        log_file = tmp_path / "audit.log"
-        logger = AuditLogger(output_path=log_file)
+        stream = io.StringIO()
+        logger = AuditLogger(output_stream=stream)
 
         logger.log_tool_start("Read", "id1", {"file_path": "/test/file.py"})
 
@@ -59,15 +79,14 @@ class TestAuditLogger:
 
         logger.close()
 
-        # Verify file was written
-        content = log_file.read_text()
+        # Verify output was written
+        content = stream.getvalue()
         assert "Read" in content
         assert "file.py" in content
 
-    def test_log_tool_end_calculates_duration(self, tmp_path):
+    def test_log_tool_end_calculates_duration(self):
         """Log tool end calculates duration."""
-        log_file = tmp_path / "audit.log"
-        logger = AuditLogger(output_path=log_file)
+        logger = AuditLogger(output_path=None, stderr=False)
 
         logger.log_tool_start("Read", "id1", {"file_path": "/test"})
         logger.log_tool_end("id1")
@@ -80,10 +99,9 @@ class TestAuditLogger:
 
         logger.close()
 
-    def test_multiple_tool_calls(self, tmp_path):
+    def test_multiple_tool_calls(self):
         """Log multiple tool calls."""
-        log_file = tmp_path / "audit.log"
-        logger = AuditLogger(output_path=log_file)
+        logger = AuditLogger(output_path=None, stderr=False)
 
         logger.log_tool_start("Read", "id1", {"file_path": "/a"})
         logger.log_tool_start("Write", "id2", {"file_path": "/b", "content": "x"})
@@ -97,10 +115,22 @@ class TestAuditLogger:
 
         logger.close()
 
-    def test_sanitize_sensitive_fields(self, tmp_path):
+    def test_log_tool_context_manager(self):
+        """log_tool records an entry with duration on block exit."""
+        logger = AuditLogger(output_path=None, stderr=False)
+
+        with logger.log_tool("Read", "id1", {"file_path": "/test"}) as entry:
+            assert entry.tool_name == "Read"
+
+        entries = logger.get_entries()
+        assert len(entries) == 1
+        assert entries[0].tool_use_id == "id1"
+        assert entries[0].duration_ms is not None
+        assert entries[0].duration_ms >= 0
+
+    def test_sanitize_sensitive_fields(self):
         """Sensitive fields are redacted."""
-        log_file = tmp_path / "audit.log"
-        logger = AuditLogger(output_path=log_file)
+        logger = AuditLogger(output_path=None, stderr=False)
 
         logger.log_tool_start(
             "Bash",
@@ -119,10 +149,9 @@ class TestAuditLogger:
 
         logger.close()
 
-    def test_truncate_long_values(self, tmp_path):
+    def test_truncate_long_values(self):
         """Long values are truncated."""
-        log_file = tmp_path / "audit.log"
-        logger = AuditLogger(output_path=log_file)
+        logger = AuditLogger(output_path=None, stderr=False)
 
         long_content = "x" * 500
         logger.log_tool_start("Write", "id1", {"content": long_content})
@@ -132,16 +161,16 @@ class TestAuditLogger:
 
         logger.close()
 
-    def test_text_format(self, tmp_path, capsys):
+    def test_text_format(self):
         """Test text format output."""
-        log_file = tmp_path / "audit.log"
-        logger = AuditLogger(output_path=log_file, format="text")
+        stream = io.StringIO()
+        logger = AuditLogger(format="text", output_stream=stream)
 
         logger.log_tool_start("Read", "id1", {"file_path": "/test"})
 
         logger.close()
 
-        content = log_file.read_text()
+        content = stream.getvalue()
         # Text format should have tool name and args visible
         assert "Read" in content
         assert "file_path" in content
@@ -183,8 +212,7 @@ class TestAuditLogger:
 class TestMakeAuditHook:
     """Tests for make_audit_hook factory."""
 
-    @pytest.mark.asyncio
-    async def test_hook_logs_tool_call(self, tmp_path):
+    def test_hook_logs_tool_call(self, tmp_path):
         """Hook logs tool calls."""
         log_file = tmp_path / "audit.log"
         logger = AuditLogger(output_path=log_file)
@@ -195,7 +223,7 @@ class TestMakeAuditHook:
             "tool_input": {"file_path": "/test/file.py"},
         }
 
-        result = await hook(input_data, "tool_id_123", None)
+        result = asyncio.run(hook(input_data, "tool_id_123", None))
 
         # Hook should return empty dict (no modifications)
         assert result == {}
@@ -208,8 +236,7 @@ class TestMakeAuditHook:
 
         logger.close()
 
-    @pytest.mark.asyncio
-    async def test_hook_handles_missing_tool_name(self, tmp_path):
+    def test_hook_handles_missing_tool_name(self, tmp_path):
         """Hook handles missing tool_name gracefully."""
         log_file = tmp_path / "audit.log"
         logger = AuditLogger(output_path=log_file)
@@ -217,7 +244,7 @@ class TestMakeAuditHook:
 
         input_data = {"tool_input": {"file_path": "/test"}}
 
-        result = await hook(input_data, "id1", None)
+        result = asyncio.run(hook(input_data, "id1", None))
 
         assert result == {}
         entries = logger.get_entries()
@@ -231,44 +258,28 @@ class TestCLIAuditArgs:
 
     def test_audit_log_defaults_none(self):
         """--audit-log defaults to None."""
-        import tyro
-
-        from jira_agent.cli import Args, RunArgs
-
-        args = tyro.cli(Args, args=["run", "SPE-123"])
+        args = _parse(("run", "SPE-123"))
 
         assert isinstance(args, RunArgs)
         assert args.audit_log is None
 
     def test_audit_log_accepts_path(self):
         """--audit-log accepts a path."""
-        import tyro
-
-        from jira_agent.cli import Args, RunArgs
-
-        args = tyro.cli(Args, args=["run", "SPE-123", "--audit-log", "/tmp/audit.log"])
+        args = _parse(("run", "SPE-123", "--audit-log", "/tmp/audit.log"))
 
         assert isinstance(args, RunArgs)
         assert args.audit_log == Path("/tmp/audit.log")
 
     def test_audit_stderr_defaults_false(self):
         """--audit-stderr defaults to False."""
-        import tyro
-
-        from jira_agent.cli import Args, RunArgs
-
-        args = tyro.cli(Args, args=["run", "SPE-123"])
+        args = _parse(("run", "SPE-123"))
 
         assert isinstance(args, RunArgs)
         assert args.audit_stderr is False
 
     def test_audit_stderr_flag(self):
         """--audit-stderr flag works."""
-        import tyro
-
-        from jira_agent.cli import Args, RunArgs
-
-        args = tyro.cli(Args, args=["run", "SPE-123", "--audit-stderr"])
+        args = _parse(("run", "SPE-123", "--audit-stderr"))
 
         assert isinstance(args, RunArgs)
         assert args.audit_stderr is True
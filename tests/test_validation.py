@@ -1,7 +1,9 @@
 """Tests for input validation."""
 
 import os
+import shutil
 import subprocess
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -125,71 +127,61 @@ class TestValidateEnvVars:
             assert "JIRA_API_TOKEN" in error_msg
 
 
+@pytest.fixture(scope="module")
+def committed_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A git repo with one committed file, built once per module.
+
+    Tests copy this instead of paying git init/config/add/commit
+    (five subprocesses) each.
+    """
+    repo = tmp_path_factory.mktemp("repo-template")
+    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "config", "user.email", "test@example.com"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    (repo / "file.txt").write_text("content")
+    subprocess.run(["git", "add", "file.txt"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Initial commit"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    return repo
+
+
+@pytest.fixture
+def clean_git_repo(committed_repo_template: Path, tmp_path: Path) -> Path:
+    """Per-test copy of the committed repo template."""
+    repo = tmp_path / "repo"
+    shutil.copytree(committed_repo_template, repo)
+    return repo
+
+
 class TestValidateGitState:
     """Tests for git state validation."""
 
-    def test_clean_repo_passes(self, tmp_path):
+    def test_clean_repo_passes(self, clean_git_repo: Path):
         """Clean repository passes validation."""
-        # Create a git repo with initial commit
-        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=tmp_path,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=tmp_path,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create a file and commit it
-        (tmp_path / "file.txt").write_text("content")
-        subprocess.run(["git", "add", "file.txt"], cwd=tmp_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=tmp_path,
-            check=True,
-            capture_output=True,
-        )
-
         # Should not raise
-        validate_git_state(tmp_path)
+        validate_git_state(clean_git_repo)
 
-    def test_dirty_repo_fails(self, tmp_path):
+    def test_dirty_repo_fails(self, clean_git_repo: Path):
         """Repository with uncommitted changes fails validation."""
-        # Create a git repo
-        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=tmp_path,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=tmp_path,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create and commit a file
-        (tmp_path / "file.txt").write_text("content")
-        subprocess.run(["git", "add", "file.txt"], cwd=tmp_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=tmp_path,
-            check=True,
-            capture_output=True,
-        )
-
-        # Modify the file without committing
-        (tmp_path / "file.txt").write_text("modified content")
+        # Modify the committed file without committing
+        (clean_git_repo / "file.txt").write_text("modified content")
 
         with pytest.raises(ValidationError) as exc_info:
-            validate_git_state(tmp_path)
+            validate_git_state(clean_git_repo)
 
         assert "Uncommitted changes" in str(exc_info.value)
         assert "file.txt" in str(exc_info.value)